@@ -0,0 +1,345 @@
+"""
+In-process benchmark runner
+
+One worker process per core imports the satcore engine once and takes
+(solver, formula) tasks from a shared queue, so interpreter start-up and
+imports are paid once per worker instead of once per run. In-process solvers
+get the timeout as a time budget and stop on their own, answering unknown
+with their statistics intact; a worker that overruns the timeout by more
+than GRACE anyway is killed and replaced. Parse time and solve time are
+recorded separately. With --verify every sat answer that comes with a model
+is checked against a fresh parse of the formula, and with --check-proofs the
+in-process solvers log a DRAT proof that is checked for every unsat answer.
+A worker announces such a check before starting it, and the check runs
+without a kill deadline: it can take longer than the solve, and killing it
+would record a solved instance as a timeout.
+--stats adds the in-process solvers' phase times and search counters to the
+CSV, one column per statistic and solver.
+
+Run from the repository root:
+    python scripts/benchmark_pool.py [--workers N] [--timeout SECONDS]
+"""
+
+import argparse
+import csv
+import math
+import multiprocessing
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import time
+
+# Configuration
+SOLVERS_DIR = "solvers"
+BENCHMARK_DIR = "benchmark"
+NUM_FORMULAS = 100  # From 1 to 100
+TIMEOUT = 5  # timeout in seconds per run
+CSV_FILENAME = "benchmark_results_pool.csv"
+GRACE = 1.0  # Extra seconds a worker gets to report a timeout itself before it is killed
+
+# Solver label -> (strategy, heuristic) run in-process, or None for a script
+# without an importable API, which the worker runs in a subprocess
+SOLVERS = {
+    "1.py": ("chronological", "vsids"),
+    "2.py": ("chronological", "bohm"),
+    "3.py": ("restart", "vsids"),
+    "4.py": ("restart", "bohm"),
+    "dpll-solver.py": None,
+}
+
+sys.path.insert(0, SOLVERS_DIR)
+from satcore import make_solver, parse_cnf, parse_dimacs  # noqa: E402
+from satcore.budget import Budget  # noqa: E402
+from satcore.model import check_model, parse_model  # noqa: E402
+from satcore.proof import DratWriter, check_proof_file  # noqa: E402
+from satcore.stats import SolverStats  # noqa: E402
+
+STAT_FIELDS = list(SolverStats().as_dict())
+
+
+def parse_result(output):
+    """Map a solver's stdout to sat/unsat/unknown"""
+    output_lower = output.lower()
+    if "sat" in output_lower and "unsat" not in output_lower:
+        return "sat"
+    elif "unsat" in output_lower:
+        return "unsat"
+    else:
+        return "unknown"
+
+
+def verify_model(cnf_path, model):
+    """True/False whether model satisfies the formula, None if there is no model to check"""
+    if not model:
+        return None
+    db, num_vars, num_clauses = parse_dimacs(cnf_path)
+    return check_model(db, model)
+
+
+def run_task(solver, cnf_path, timeout, verify=False, check_proofs=False, checking=None):
+    """
+    Solve one formula; returns its result and timings in seconds. checking,
+    if given, is called once the answer is in and before a model or proof
+    check starts.
+    """
+    config = SOLVERS[solver]
+    start = time.perf_counter()
+
+    if config is None:
+        try:
+            completed = subprocess.run(
+                [sys.executable, os.path.join(SOLVERS_DIR, solver), cnf_path],
+                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        except subprocess.TimeoutExpired:
+            return {"time": float('inf'), "parse": None, "solve": None, "result": "unknown"}
+        elapsed = time.perf_counter() - start
+        outcome = {"time": elapsed, "parse": None, "solve": None,
+                   "result": parse_result(completed.stdout)}
+        if verify and outcome["result"] == "sat":
+            if checking is not None:
+                checking()
+            outcome["verified"] = verify_model(cnf_path, parse_model(completed.stdout.splitlines()))
+        return outcome
+
+    budget = Budget(seconds=timeout)
+    formula = parse_cnf(cnf_path)
+    parsed = time.perf_counter()
+    solver = make_solver(*config)
+    solver.budget = budget
+    if check_proofs:
+        fd, proof_path = tempfile.mkstemp(suffix=".drat")
+        solver.proof = DratWriter(os.fdopen(fd, "wb"))
+    try:
+        satisfiable, model = solver.solve(formula)
+        if check_proofs:
+            solver.proof.close()
+        end = time.perf_counter()
+        if satisfiable is None:
+            outcome = {"time": float('inf'), "parse": parsed - start, "solve": None,
+                       "result": "unknown"}
+        else:
+            outcome = {"time": end - start, "parse": parsed - start, "solve": end - parsed,
+                       "result": "sat" if satisfiable else "unsat"}
+        solver.stats.times["parse"] = parsed - start
+        outcome["stats"] = solver.stats.as_dict()
+        if checking is not None and (verify and satisfiable or check_proofs and satisfiable is False):
+            checking()
+        if verify and satisfiable:
+            # Open variables do not matter to the solver's model; fill them in
+            model = {var: model.get(var, False) for var in range(1, formula.num_vars + 1)}
+            outcome["verified"] = verify_model(cnf_path, model)
+        if check_proofs and satisfiable is False:
+            outcome["verified"] = check_proof_file(cnf_path, proof_path)
+    finally:
+        if check_proofs:
+            solver.proof.file.close()
+            os.remove(proof_path)
+    return outcome
+
+
+def worker(worker_id, tasks, events, timeout, verify, check_proofs):
+    """Take tasks until the None sentinel, announcing each before running it"""
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        task_id, solver, cnf_path = task
+        events.put(("start", worker_id, task_id, None))
+        try:
+            outcome = run_task(solver, cnf_path, timeout, verify, check_proofs,
+                               lambda: events.put(("checking", worker_id, task_id, None)))
+        except Exception as e:
+            outcome = {"time": float('inf'), "parse": None, "solve": None, "result": "ERROR",
+                       "error": repr(e)}
+        events.put(("done", worker_id, task_id, outcome))
+
+
+def run_benchmark(solvers, num_formulas, num_workers, timeout, verify=False, check_proofs=False):
+    """Run every solver on every formula; returns results[solver][formula_number]"""
+    results = {solver: {} for solver in solvers}
+    tasks = []
+    for i in range(1, num_formulas + 1):
+        cnf_path = os.path.join(BENCHMARK_DIR, f"formula_{i}.cnf")
+        if not os.path.isfile(cnf_path):
+            print(f"Warning: {cnf_path} not found, skipping.")
+            continue
+        for solver in solvers:
+            tasks.append((solver, i, cnf_path))
+
+    task_queue = multiprocessing.Queue()
+    events = multiprocessing.Queue()
+    for task_id, (solver, _, cnf_path) in enumerate(tasks):
+        task_queue.put((task_id, solver, cnf_path))
+
+    workers = {}  # Worker id -> process
+    running = {}  # Worker id -> (task id, deadline); no deadline while an answer is checked
+    next_id = 0
+
+    def spawn():
+        nonlocal next_id
+        process = multiprocessing.Process(target=worker,
+                                          args=(next_id, task_queue, events, timeout, verify,
+                                                check_proofs),
+                                          daemon=True)
+        process.start()
+        workers[next_id] = process
+        next_id += 1
+
+    for _ in range(min(num_workers, len(tasks))):
+        spawn()
+
+    remaining = len(tasks)
+    while remaining > 0:
+        # Drain every pending event before enforcing deadlines
+        pending = []
+        try:
+            pending.append(events.get(timeout=0.05))
+            while True:
+                pending.append(events.get_nowait())
+        except queue.Empty:
+            pass
+
+        for kind, worker_id, task_id, outcome in pending:
+            if worker_id not in workers:
+                continue  # Sent just before the worker was killed
+            solver, i, _ = tasks[task_id]
+            if kind == "start":
+                running[worker_id] = (task_id, time.monotonic() + timeout + GRACE)
+            elif kind == "checking":
+                running[worker_id] = (task_id, math.inf)
+            else:
+                del running[worker_id]
+                if outcome["result"] == "ERROR":
+                    print(f"Error running {solver} on formula {i}: {outcome.get('error')}")
+                results[solver][i] = outcome
+                remaining -= 1
+
+        now = time.monotonic()
+        for worker_id, (task_id, deadline) in list(running.items()):
+            if now < deadline:
+                continue
+            solver, i, _ = tasks[task_id]
+            print(f"{solver} timed out on formula {i}.")
+            workers.pop(worker_id).kill()
+            del running[worker_id]
+            results[solver][i] = {"time": float('inf'), "parse": None, "solve": None,
+                                  "result": "unknown"}
+            remaining -= 1
+            spawn()
+
+    for _ in workers:
+        task_queue.put(None)
+    for process in workers.values():
+        process.join()
+
+    return results
+
+
+def format_time(seconds):
+    if seconds is None:
+        return ""
+    return "inf" if math.isinf(seconds) else f"{seconds:.4f}"
+
+
+def print_summary(results):
+    print("Benchmark Results:")
+    print("=================")
+    for solver, solver_results in results.items():
+        runs = solver_results.values()
+        solved = [r for r in runs if not math.isinf(r["time"])]
+        timeouts = sum(1 for r in runs if math.isinf(r["time"]) and r["result"] == "unknown")
+        errors = sum(1 for r in runs if r["result"] == "ERROR")
+        wrong = sum(1 for r in runs if r.get("verified") is False)  # Bad models or proofs
+        print(f"Solver: {solver}")
+        print(f"  Solved: {len(solved)} / {len(solver_results)}")
+        print(f"  Timeouts: {timeouts}")
+        print(f"  Errors: {errors}")
+        if wrong:
+            print(f"  Failed checks: {wrong}")
+        if solved:
+            print(f"  Average Time (for solved instances): "
+                  f"{sum(r['time'] for r in solved) / len(solved):.4f} seconds")
+            timed = [r for r in solved if r["parse"] is not None]
+            if timed:
+                print(f"  Average Parse / Solve: "
+                      f"{sum(r['parse'] for r in timed) / len(timed):.4f} / "
+                      f"{sum(r['solve'] for r in timed) / len(timed):.4f} seconds")
+        print()
+
+
+def write_csv(results, filename, stats=False):
+    """
+    One row per formula: time, parse, solve, result and model check per
+    solver, then the winner. With stats, every STAT_FIELDS entry per solver
+    follows the winner columns.
+    """
+    solvers = list(results)
+    formulas = sorted(set(i for solver in solvers for i in results[solver]))
+    header = ["formula"]
+    for solver in solvers:
+        header.extend([f"{solver}_time", f"{solver}_parse", f"{solver}_solve", f"{solver}_result",
+                       f"{solver}_verified"])
+    header += ["winner", "winner_time"]
+    if stats:
+        header.extend(f"{solver}_{field}" for solver in solvers for field in STAT_FIELDS)
+
+    missing = {"time": float('inf'), "parse": None, "solve": None, "result": "unknown"}
+    with open(filename, "w", newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(header)
+
+        for i in formulas:
+            row = [f"formula_{i}"]
+            for solver in solvers:
+                data = results[solver].get(i, missing)
+                verified = data.get("verified")
+                row.extend([format_time(data["time"]), format_time(data["parse"]),
+                            format_time(data["solve"]), data["result"],
+                            "" if verified is None else verified])
+
+            valid = [(solver, results[solver][i]["time"]) for solver in solvers
+                     if i in results[solver] and not math.isinf(results[solver][i]["time"])]
+            if valid:
+                winner, winner_time = min(valid, key=lambda x: x[1])
+                row.extend([winner, f"{winner_time:.4f}"])
+            else:
+                row.extend(["None", "inf"])
+
+            if stats:
+                for solver in solvers:
+                    solver_stats = results[solver].get(i, missing).get("stats", {})
+                    row.extend(solver_stats.get(field, "") for field in STAT_FIELDS)
+            writer.writerow(row)
+
+    print(f"CSV results saved to {filename}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the solvers with a worker pool")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument("--formulas", type=int, default=NUM_FORMULAS)
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--csv", default=CSV_FILENAME)
+    parser.add_argument("--verify", action="store_true",
+                        help="check every model returned with a sat answer")
+    parser.add_argument("--check-proofs", action="store_true",
+                        help="log DRAT proofs and check every unsat answer (drat-trim if installed)")
+    parser.add_argument("--stats", action="store_true",
+                        help="add phase times and search counters to the CSV")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.solvers, args.formulas, args.workers, args.timeout, args.verify,
+                            args.check_proofs)
+    print_summary(results)
+    write_csv(results, args.csv, args.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Cube-and-conquer solver
+Splits a formula into BOHM-ranked cubes and solves them in a process pool,
+or writes them out as iCNF with --icnf
+"""
+
+from satcore.cubes import main
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,10 @@
 import sys
 import itertools
 
+from satcore import parse_dimacs
+
 SAT = "sat"
 UNSAT = "unsat"
-COMMENT = "c"
-PROBLEM = "p"
-END = "0"
 
 # in what follows, a *formula* is a collection of clauses,
 # a clause is a collection of literals,
@@ -17,25 +16,8 @@ END = "0"
 #         the number of variables,
 #         and the number of clauses
 def parse_dimacs_path(path):
-    count = 0
-    lines = []
-    with open(path, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            literals = line.split()
-            first_char = line[0]
-            if first_char == PROBLEM:
-                num_vars = int(literals[2])
-                num_clauses = int(literals[3])
-                continue
-            if first_char == COMMENT:
-                continue
-            count += 1
-            integer_line = [int(lit) for lit in literals if lit != END]
-            lines.append(integer_line)
-    return lines, num_vars, num_clauses
+    clauses, num_vars, num_clauses = parse_dimacs(path)
+    return list(clauses), num_vars, num_clauses
 
 def evaluate(cnf, v):
     for clause in cnf:
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Portfolio solver
+Races the chronological/restart x VSIDS/BOHM configurations and seeded
+variants on one formula and reports the first definitive answer
+"""
+
+from satcore.portfolio import main
+
+
+if __name__ == "__main__":
+    main()
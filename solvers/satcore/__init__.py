@@ -0,0 +1,61 @@
+"""
+Shared DPLL/CDCL engine behind the solvers in this directory
+
+Strategies and heuristics are looked up by name in STRATEGIES and
+HEURISTICS; make_solver builds a solver from those names, so callers can
+run any configuration in-process without going through the scripts.
+"""
+
+from .analysis import analyze_conflict
+from .clausedb import ClauseDB
+from .dimacs import (parse_dimacs, parse_dimacs_bytes, parse_binary_cnf, binary_cnf, open_dimacs,
+                     DimacsError)
+from .formula import CNFFormula, parse_cnf
+from .heap import VarHeap
+from .heuristics import HEURISTICS, register_heuristic, VSIDSHeuristic, BOHMHeuristic
+from .incremental import IncrementalSolver, make_incremental_solver
+from .literals import FALSE, TRUE, UNASSIGNED, NO_REASON, encode, decode
+from .occurrence import OccurrenceCounts
+from .phase import PhaseSelector, POLARITY_MODES
+from .propagation import WatchedPropagator
+from .solver import DPLLSolver, make_solver
+from .strategies import (STRATEGIES, register_strategy, ChronologicalBacktrackingStrategy,
+                         RestartStrategy)
+from .trail import Trail
+
+__all__ = [
+    "CNFFormula",
+    "parse_cnf",
+    "DPLLSolver",
+    "make_solver",
+    "IncrementalSolver",
+    "make_incremental_solver",
+    "STRATEGIES",
+    "register_strategy",
+    "ChronologicalBacktrackingStrategy",
+    "RestartStrategy",
+    "HEURISTICS",
+    "register_heuristic",
+    "VSIDSHeuristic",
+    "BOHMHeuristic",
+    "ClauseDB",
+    "FALSE",
+    "TRUE",
+    "UNASSIGNED",
+    "NO_REASON",
+    "encode",
+    "decode",
+    "parse_dimacs",
+    "parse_dimacs_bytes",
+    "parse_binary_cnf",
+    "binary_cnf",
+    "open_dimacs",
+    "DimacsError",
+    "WatchedPropagator",
+    "Trail",
+    "VarHeap",
+    "OccurrenceCounts",
+    "PhaseSelector",
+    "POLARITY_MODES",
+    "analyze_conflict",
+]
@@ -0,0 +1,111 @@
+"""
+First-UIP conflict analysis
+
+Starting from the falsified clause, literals assigned at the current
+decision level are resolved away with their reason clauses, newest first,
+until exactly one remains: the first unique implication point. The learned
+clause holds its negation plus the false literals from lower levels, and is
+asserting at the highest of those levels.
+
+When an assumption turns out false before it is decided, analyze_final
+walks the implication graph back from it instead, collecting the earlier
+assumptions it rests on.
+"""
+
+from typing import List, Tuple
+
+from .clausedb import ClauseDB
+from .literals import NO_REASON
+from .trail import Trail
+
+
+def analyze_conflict(trail: Trail, db: ClauseDB, conflict: int) -> Tuple[List[int], int]:
+    """
+    Derive the first-UIP clause for a conflict at the current decision level.
+    Returns the learned clause (encoded literals), with the asserting literal
+    first and a literal of the backjump level second, and that backjump level.
+    """
+    level = trail.level
+    reason = trail.reason
+    lits = db.lits
+    start = db.start
+    size = db.size
+    current_level = trail.decision_level()
+
+    seen = set()
+    learned = [0]
+    open_count = 0  # Seen literals of the current level not yet resolved
+    index = len(trail.trail) - 1
+    clause = conflict
+    pivot = 0
+
+    while True:
+        base = start[clause]
+        for k in range(base, base + size[clause]):
+            lit = lits[k]
+            var = lit >> 1
+            if var == pivot or var in seen or level[var] == 0:
+                continue
+            seen.add(var)
+            if level[var] == current_level:
+                open_count += 1
+            else:
+                learned.append(lit)
+
+        # Next literal to resolve on: the newest seen one on the trail
+        while (trail.trail[index] >> 1) not in seen:
+            index -= 1
+        uip = trail.trail[index]
+        index -= 1
+        pivot = uip >> 1
+        open_count -= 1
+
+        if open_count == 0:
+            break
+        clause = reason[pivot]
+
+    learned[0] = uip ^ 1
+
+    backjump_level = 0
+    if len(learned) > 1:
+        highest = 1
+        for i in range(2, len(learned)):
+            if level[learned[i] >> 1] > level[learned[highest] >> 1]:
+                highest = i
+        learned[1], learned[highest] = learned[highest], learned[1]
+        backjump_level = level[learned[1] >> 1]
+
+    return learned, backjump_level
+
+
+def analyze_final(trail: Trail, db: ClauseDB, lit: int) -> List[int]:
+    """
+    The assumptions that together force the assumption lit false: lit itself
+    and every decision its negation was implied from. Only valid while every
+    open decision level was opened for an assumption.
+    """
+    failed = [lit]
+    level = trail.level
+    if level[lit >> 1] == 0:
+        return failed
+
+    reason = trail.reason
+    lits = db.lits
+    start = db.start
+    size = db.size
+    seen = {lit >> 1}
+    for index in range(len(trail.trail) - 1, trail.trail_lim[0] - 1, -1):
+        assigned = trail.trail[index]
+        var = assigned >> 1
+        if var not in seen:
+            continue
+        clause = reason[var]
+        if clause == NO_REASON:
+            failed.append(assigned)
+            continue
+        base = start[clause]
+        for k in range(base, base + size[clause]):
+            other = lits[k] >> 1
+            if level[other] > 0:
+                seen.add(other)
+    return failed
@@ -0,0 +1,83 @@
+"""
+Resource budgets
+
+A Budget caps one solve by conflicts, propagations, wall-clock seconds and
+resident memory. The search loop asks it once per iteration: the two
+counters are compared every time, the clock and the memory only every
+CHECK_INTERVAL iterations, so an unlimited or counter-only budget costs a
+couple of comparisons. When a limit is reached the solver gives up with
+result None (printed as `unknown`) and keeps its statistics, instead of
+being killed from outside.
+
+Work that can run long inside one iteration, the preprocessor's passes and
+catching the occurrence counts up after a deep backtrack, asks expired()
+for the clock and memory alone. Once one of those limits is reached it
+stays reached, so the search loop's next check stops the search.
+"""
+
+import os
+import sys
+import time
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Not on Windows; memory limits are then ignored
+    resource = None
+
+CHECK_INTERVAL = 32  # Search iterations between clock and memory checks
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def resident_memory() -> Optional[int]:
+    """
+    Resident set size of this process in bytes: the current one where /proc
+    shows it, which matters for long-lived worker processes, else the peak.
+    None where neither is known.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+class Budget:
+    """Limits for a solve; None leaves a resource unlimited. The clock starts at construction."""
+
+    def __init__(self, conflicts: Optional[int] = None, propagations: Optional[int] = None,
+                 seconds: Optional[float] = None, memory_mb: Optional[float] = None):
+        self.conflicts = conflicts
+        self.propagations = propagations
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+        self.memory = None if memory_mb is None else int(memory_mb * 1024 * 1024)  # Bytes
+        self.countdown = CHECK_INTERVAL
+        self.expired_limit = None  # "time" or "memory" once reached
+
+    def exhausted(self, solver) -> Optional[str]:
+        """Name of the first limit the solver has reached, or None"""
+        if self.conflicts is not None and solver.conflicts >= self.conflicts:
+            return "conflicts"
+        if self.propagations is not None and solver.propagations >= self.propagations:
+            return "propagations"
+        return self.expired()
+
+    def expired(self) -> Optional[str]:
+        """Name of the clock or memory limit reached, or None; looked up every CHECK_INTERVAL calls"""
+        if self.expired_limit is not None:
+            return self.expired_limit
+        self.countdown -= 1
+        if self.countdown > 0:
+            return None
+        self.countdown = CHECK_INTERVAL
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.expired_limit = "time"
+        elif self.memory is not None:
+            used = resident_memory()
+            if used is not None and used >= self.memory:
+                self.expired_limit = "memory"
+        return self.expired_limit
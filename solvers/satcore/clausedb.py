@@ -0,0 +1,111 @@
+"""
+Compact clause database
+
+Every clause lives in one flat array('i') of encoded literals. Two parallel
+arrays hold each clause's offset into that buffer and its length, so a
+clause costs its literals plus 12 bytes instead of a Python list of int
+objects. Learned clauses are appended to the same buffer.
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Iterable, Iterator, List
+
+from .literals import encode, decode
+
+END = encode(0)  # A DIMACS clause terminator in encoded form; no variable uses it
+
+
+class ClauseDB:
+    """Flat buffer of encoded literals addressed by clause index"""
+
+    def __init__(self):
+        self.lits = array('i')  # Encoded literals of all clauses, back to back
+        self.start = array('q')  # Clause -> offset of its first literal
+        self.size = array('i')  # Clause -> number of literals
+        self.max_var = 0
+
+    def __len__(self) -> int:
+        return len(self.size)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        for index in range(len(self.size)):
+            yield self.clause(index)
+
+    def add(self, clause: Iterable[int]) -> int:
+        """Append a DIMACS clause, dropping repeated literals; returns its index"""
+        codes = [encode(lit) for lit in clause]
+        if len(set(codes)) != len(codes):
+            codes = list(dict.fromkeys(codes))
+        return self.add_encoded(codes)
+
+    def add_encoded(self, codes: List[int]) -> int:
+        """Append a clause of encoded literals; returns its index"""
+        index = len(self.size)
+        self.start.append(len(self.lits))
+        self.size.append(len(codes))
+        self.lits.extend(codes)
+        if codes:
+            self.max_var = max(self.max_var, max(codes) >> 1)
+        return index
+
+    def add_terminated(self, codes: List[int]):
+        """
+        Append the clauses of a flat list of encoded literals in which every
+        clause, including the last, is followed by END. Repeated literals are
+        dropped as in add. Terminators are found with list.index and each
+        buffer is filled with a single fromlist; the one step run for every
+        clause is a set of its literals to spot repeats, and only the clauses
+        that have one are rebuilt.
+        """
+        ends = []
+        end = -1
+        find = codes.index
+        try:
+            while True:
+                end = find(END, end + 1)
+                ends.append(end)
+        except ValueError:
+            pass
+        if not ends:
+            return
+        starts = [0]
+        starts += [end + 1 for end in ends[:-1]]
+        sizes = [end - start for start, end in zip(starts, ends)]
+        distinct = [len(set(codes[start:end])) for start, end in zip(starts, ends)]
+
+        if distinct != sizes:
+            # Rare: rebuild the clauses that repeat a literal, last first so
+            # the offsets of the earlier ones stay valid
+            codes = list(codes)
+            for i in reversed(range(len(sizes))):
+                if distinct[i] != sizes[i]:
+                    codes[starts[i]:ends[i]] = dict.fromkeys(codes[starts[i]:ends[i]])
+            sizes = distinct
+
+        self.start.fromlist(list(accumulate([len(self.lits)] + sizes[:-1])))
+        self.size.fromlist(sizes)
+        self.lits.fromlist([code for code in codes if code > END])
+        self.max_var = max(self.max_var, max(codes) >> 1)
+
+    def copy(self) -> "ClauseDB":
+        """Independent copy; solving reorders literals and appends learned clauses"""
+        other = ClauseDB()
+        other.lits = array('i', self.lits)
+        other.start = array('q', self.start)
+        other.size = array('i', self.size)
+        other.max_var = self.max_var
+        return other
+
+    def literals(self, index: int) -> array:
+        """Encoded literals of a clause (a copy)"""
+        base = self.start[index]
+        return self.lits[base:base + self.size[index]]
+
+    def clause(self, index: int) -> List[int]:
+        """DIMACS literals of a clause"""
+        return [decode(lit) for lit in self.literals(index)]
+
+    def nbytes(self) -> int:
+        """Bytes held by the clause buffers"""
+        return sum(buffer.itemsize * len(buffer) for buffer in (self.lits, self.start, self.size))
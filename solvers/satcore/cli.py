@@ -0,0 +1,155 @@
+"""
+Command-line entry point shared by the numbered solver scripts
+
+    python solvers/1.py formula.cnf
+    python solvers/1.py formula.cnf --strategy restart --heuristic bohm
+
+Each script only fixes its default strategy and heuristic; every registered
+combination is reachable from any of them.
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .budget import Budget
+from .formula import CNFFormula, parse_cnf
+from .heuristics import HEURISTICS
+from .model import model_lines
+from .phase import POLARITY_MODES
+from .preprocess import preprocess
+from .profiling import make_profiler
+from .proof import DratWriter
+from .solver import PURE_MODES, DPLLSolver, make_solver
+from .strategies import STRATEGIES
+
+
+def build_parser(strategy: str, heuristic: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="DPLL SAT solver")
+    parser.add_argument("cnf_file", help="DIMACS CNF file, optionally gzip/xz/bzip2 compressed")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default=strategy)
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default=heuristic)
+    parser.add_argument("--polarity", choices=POLARITY_MODES, default="saved",
+                        help="value tried first for a decision variable")
+    parser.add_argument("--seed", type=int, default=None, help="seed for --polarity random")
+    parser.add_argument("--no-learning", action="store_true",
+                        help="plain DPLL search without clause learning")
+    parser.add_argument("--pure", choices=PURE_MODES, default="all",
+                        help="pure literal elimination at every node, at level 0 only, or never")
+    parser.add_argument("--preprocess", action="store_true",
+                        help="simplify with subsumption and variable elimination before search")
+    parser.add_argument("--model", action="store_true",
+                        help="print the satisfying assignment as `v` lines")
+    parser.add_argument("--proof", metavar="PATH",
+                        help="write a DRAT proof, checkable if the answer is unsat")
+    parser.add_argument("--proof-format", choices=("binary", "text"), default="binary")
+    parser.add_argument("--stats", action="store_true",
+                        help="print phase times and search counters as `c` lines")
+    parser.add_argument("--stats-json", metavar="PATH", help="write the statistics as JSON")
+    parser.add_argument("--profile", choices=("sample", "cprofile"),
+                        help="profile the run and write collapsed stacks for flamegraph tools; "
+                             "also records decision/propagation latency histograms")
+    parser.add_argument("--profile-output", metavar="PATH", default="profile.folded",
+                        help="collapsed-stack file (cprofile also writes PATH.prof)")
+    parser.add_argument("--profile-interval", type=float, default=2.0, metavar="MS",
+                        help="sampling interval in milliseconds of CPU time")
+    parser.add_argument("--max-conflicts", type=int, metavar="N",
+                        help="answer unknown after N conflicts")
+    parser.add_argument("--max-propagations", type=int, metavar="N",
+                        help="answer unknown after N propagated literals")
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS",
+                        help="answer unknown once the run has taken this long")
+    parser.add_argument("--max-memory", type=float, metavar="MB",
+                        help="answer unknown once resident memory reaches this")
+    return parser
+
+
+def make_budget(args) -> Optional[Budget]:
+    """The budget given by the limit flags, None if there are none"""
+    limits = (args.max_conflicts, args.max_propagations, args.time_limit, args.max_memory)
+    if all(limit is None for limit in limits):
+        return None
+    return Budget(*limits)
+
+
+def run_solver(solver: DPLLSolver, formula: CNFFormula,
+               simplify: bool = False) -> Tuple[Optional[bool], Dict[int, bool]]:
+    """
+    Solve formula, simplifying it with satcore.preprocess first if asked; the
+    preprocessing time goes into solver.stats, the proof into solver.proof,
+    and solver.budget covers preprocessing as well as search
+    """
+    if not simplify:
+        return solver.solve(formula)
+
+    start = time.perf_counter()
+    preprocessor = preprocess(formula, proof=solver.proof, budget=solver.budget)
+    preprocess_time = time.perf_counter() - start
+    if preprocessor.unsat:
+        if solver.proof is not None:
+            solver.proof.add([])
+        result, assignment = False, {}
+    elif solver.budget is not None and solver.budget.expired_limit is not None:
+        # Preprocessing used up the budget; building the search state would overrun it
+        solver.exhausted = solver.stats.exhausted = solver.budget.expired_limit
+        result, assignment = None, {}
+    else:
+        result, assignment = solver.solve(preprocessor.formula())
+        if result:
+            assignment = preprocessor.extend_model(assignment)
+    solver.stats.times["preprocess"] = preprocess_time
+    return result, assignment
+
+
+def main(argv: Optional[List[str]] = None, strategy: str = "restart", heuristic: str = "vsids"):
+    args = build_parser(strategy, heuristic).parse_args(argv)
+
+    proof = None
+    profiler = None
+    budget = make_budget(args)  # Created first, so the time limit covers parsing too
+    if args.profile:
+        profiler = make_profiler(args.profile, args.profile_interval / 1000)
+        profiler.start()
+    try:
+        start = time.perf_counter()
+        formula = parse_cnf(args.cnf_file)
+        parse_time = time.perf_counter() - start
+        solver = make_solver(args.strategy, args.heuristic, not args.no_learning, args.pure,
+                             polarity=args.polarity, seed=args.seed)
+        solver.latency = profiler is not None
+        solver.budget = budget
+        if args.proof:
+            proof = solver.proof = DratWriter(args.proof, args.proof_format == "binary")
+
+        result, assignment = run_solver(solver, formula, args.preprocess)
+        stats = solver.stats
+        stats.times["parse"] = parse_time
+
+        if result:
+            print("sat")
+            if args.model:
+                print("\n".join(model_lines(assignment, formula.num_vars)))
+        elif result is None:
+            print("unknown")
+        else:
+            print("unsat")
+        if profiler is not None:
+            profiler.stop()
+            profiler.write(args.profile_output)
+            profiler = None
+        if args.stats or result is None:
+            print("\n".join(stats.lines()))  # Partial statistics when a budget ran out
+        if stats.latency is not None:
+            print("\n".join(stats.latency_lines()))
+        if args.stats_json:
+            stats.write_json(args.stats_json)
+
+    except Exception as e:
+        print("unknown")
+        sys.exit(1)
+    finally:
+        if proof is not None:
+            proof.close()
+        if profiler is not None:
+            profiler.stop()
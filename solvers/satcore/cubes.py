@@ -0,0 +1,198 @@
+"""
+Cube-and-conquer
+
+The cuber splits one formula into cubes: partial assignments that together
+cover every model. It branches on the variable the BOHM heuristic ranks
+highest, propagates, and drops a branch as soon as propagation refutes it,
+stopping at a fixed depth. The cubes are then either solved independently
+by a process pool, where idle workers take the next cube and the first
+satisfiable cube ends the run, or written out as an iCNF file for other
+machines.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .formula import CNFFormula, parse_cnf
+from .heuristics import BOHMHeuristic
+from .literals import UNASSIGNED, decode
+from .model import model_lines
+from .occurrence import OccurrenceCounts
+from .propagation import WatchedPropagator
+from .solver import make_solver
+from .trail import Trail
+
+
+class Cuber:
+    """Splits a formula into cubes by BOHM-ranked branching with unit propagation"""
+
+    def __init__(self, formula: CNFFormula):
+        # A copy: propagation reorders clause literals and assigns variables
+        formula = CNFFormula(formula.num_vars, formula.clauses.copy())
+        self.formula = formula
+        self.heuristic = BOHMHeuristic(polarity="bohm")
+        self.propagator = WatchedPropagator(formula.clauses, formula.num_vars)
+        self.trail = Trail(formula.assignment)
+        self.counts = OccurrenceCounts(formula.clauses, formula.num_vars)  # Scored by the heuristic
+        self.heuristic.on_setup(formula, self.counts)
+        self.refuted = 0  # Branches closed by propagation before the cutoff
+
+    def cubes(self, depth: int) -> List[List[int]]:
+        """
+        Cubes as lists of DIMACS literals, each at most depth decisions long.
+        An empty list means propagation alone refuted the formula.
+        """
+        trail = self.trail
+        if self.propagator.has_empty_clause:
+            return []
+        for lit in self.propagator.units:
+            value = trail.value(lit)
+            if value is False:
+                return []
+            if value is None:
+                trail.assign(lit)
+
+        cubes = []
+        self._split(depth, [], cubes)
+        self._backtrack(0)
+        return cubes
+
+    def _split(self, depth: int, decisions: List[int], cubes: List[List[int]]):
+        if not self.propagator.propagate(self.trail):
+            self.refuted += 1
+            return
+
+        formula = self.formula
+        trail = self.trail.trail
+        if len(decisions) == depth or len(trail) == formula.num_vars:
+            cubes.append([decode(lit) for lit in decisions])
+            return
+
+        for lit in trail[len(self.counts.applied):]:
+            self.counts.assign(lit)
+        var = self.heuristic.select_variable(formula)
+        if var is None:
+            cubes.append([decode(lit) for lit in decisions])
+            return
+        first = 2 * var if self.heuristic.select_polarity(formula, var) else 2 * var + 1
+
+        level = self.trail.decision_level()
+        for lit in (first, first ^ 1):
+            self.trail.new_decision_level()
+            self.trail.assign(lit)
+            decisions.append(lit)
+            self._split(depth, decisions, cubes)
+            decisions.pop()
+            self._backtrack(level)
+
+    def _backtrack(self, level: int):
+        self.heuristic.on_backtrack(self.trail.backtrack(level))
+        counts = self.counts
+        while counts.applied and self.trail.assignment[counts.applied[-1] >> 1] == UNASSIGNED:
+            counts.unassign()
+
+
+def write_icnf(formula: CNFFormula, cubes: List[List[int]], path: str):
+    """Write the formula and its cubes in iCNF: the clauses, then one 'a' line per cube"""
+    with open(path, 'w') as f:
+        f.write("p inccnf\n")
+        for clause in formula.clauses:
+            f.write(" ".join(map(str, clause)) + " 0\n")
+        for cube in cubes:
+            f.write("a " + " ".join(map(str, cube)) + " 0\n")
+
+
+_base = None  # Formula and solver configuration of a pool worker, set once per process
+_config = None
+
+
+def _init_worker(formula: CNFFormula, config: dict):
+    global _base, _config
+    _base = formula
+    _config = config
+
+
+def _solve_cube(cube: List[int]) -> Tuple[Optional[bool], Dict[int, bool]]:
+    clauses = _base.clauses.copy()
+    for lit in cube:
+        clauses.add([lit])
+    try:
+        return make_solver(**_config).solve(CNFFormula(_base.num_vars, clauses))
+    except Exception:
+        return None, {}
+
+
+def solve_cubes(formula: CNFFormula, cubes: List[List[int]], workers: Optional[int] = None,
+                config: Optional[dict] = None,
+                timeout: Optional[float] = None) -> Tuple[Optional[bool], Dict[int, bool]]:
+    """
+    Solve the cubes of formula in a process pool. Cubes are handed out one
+    at a time, so a worker that finishes early takes the next one instead of
+    idling behind a fixed share. The first satisfiable cube ends the run;
+    the formula is unsatisfiable once every cube is. Returns None as the
+    result if a cube failed or the timeout (in seconds, for the whole run)
+    passed.
+    """
+    config = config or {"strategy": "restart", "heuristic": "bohm"}
+    workers = workers or os.cpu_count() or 1
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(formula, config))
+    try:
+        outcomes = pool.imap_unordered(_solve_cube, cubes, chunksize=1)
+        unknown = False
+        for _ in cubes:
+            try:
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+                result, model = outcomes.next(timeout=wait)
+            except multiprocessing.TimeoutError:
+                return None, {}
+            if result is True:
+                return True, model
+            if result is None:
+                unknown = True
+        return (None, {}) if unknown else (False, {})
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Cube-and-conquer: split a formula and solve the cubes")
+    parser.add_argument("cnf_file", help="DIMACS CNF file, optionally gzip/xz/bzip2 compressed")
+    parser.add_argument("--depth", type=int, default=6, help="maximum decisions per cube")
+    parser.add_argument("--icnf", metavar="PATH", help="write the cubes as iCNF instead of solving")
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: number of cores)")
+    parser.add_argument("--strategy", default="restart")
+    parser.add_argument("--heuristic", default="bohm")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds before giving up")
+    parser.add_argument("--model", action="store_true",
+                        help="print the satisfying assignment as `v` lines")
+    args = parser.parse_args(argv)
+
+    try:
+        formula = parse_cnf(args.cnf_file)
+        cubes = Cuber(formula).cubes(args.depth)
+        if args.icnf:
+            write_icnf(formula, cubes, args.icnf)
+            print(f"c wrote {len(cubes)} cubes to {args.icnf}")
+            return
+        result, assignment = solve_cubes(formula, cubes, args.workers,
+                                         {"strategy": args.strategy, "heuristic": args.heuristic},
+                                         args.timeout)
+    except Exception as e:
+        print("unknown")
+        sys.exit(1)
+
+    if result is None:
+        print("unknown")
+    elif result:
+        print("sat")
+        if args.model:
+            print("\n".join(model_lines(assignment, formula.num_vars)))
+    else:
+        print("unsat")
@@ -0,0 +1,204 @@
+"""
+Streaming DIMACS CNF parser
+
+The file is read in large chunks and tokenized in bulk with bytes.split, so
+line boundaries carry no meaning: 0 is the only clause terminator, a clause
+may span several lines and a line may hold several clauses. Comment lines,
+the problem line and the SATLIB '%' trailer are only looked for in chunks
+that contain those characters. gzip, xz and bzip2 input is detected from the
+file's magic bytes and decompressed while streaming.
+
+The same parser reads DIMACS held in memory, for instance a request body.
+Next to it is a compact binary CNF: every literal as 2 * var + sign in the
+variable-length number format of binary DRAT, and a 0 byte after each
+clause. That is the engine's own literal encoding, so a payload whose
+literals all fit in a byte decodes into a clause database with one byte
+translation.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+from .clausedb import ClauseDB, END
+from .literals import encode
+
+CHUNK_SIZE = 1 << 20
+
+_MAGIC = (
+    (b"\x1f\x8b", gzip.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+    (b"BZh", bz2.open),
+)
+_BINARY_END = bytes.maketrans(b"\x00", bytes([END]))  # Binary clause terminator -> END
+_DECOMPRESS = (
+    (b"\x1f\x8b", gzip.decompress),
+    (b"\xfd7zXZ\x00", lzma.decompress),
+    (b"BZh", bz2.decompress),
+)
+
+
+class DimacsError(ValueError):
+    """Malformed DIMACS input"""
+
+
+def open_dimacs(path: str) -> BinaryIO:
+    """Open a DIMACS file for binary reading, decompressing it if needed"""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, opener in _MAGIC:
+        if head.startswith(magic):
+            return opener(path, 'rb')
+    return open(path, 'rb')
+
+
+def parse_dimacs(path: str, db: Optional[ClauseDB] = None) -> Tuple[ClauseDB, int, int]:
+    """
+    Stream the clauses of a DIMACS CNF file into a clause database.
+    Returns the database, the declared variable count (at least the largest
+    variable seen) and the declared clause count (the number read if the
+    file has no problem line).
+    """
+    with open_dimacs(path) as f:
+        return _parse_stream(f, db)
+
+
+def parse_dimacs_bytes(data: bytes, db: Optional[ClauseDB] = None) -> Tuple[ClauseDB, int, int]:
+    """parse_dimacs for DIMACS text in memory, plain or gzip/xz/bzip2 compressed"""
+    for magic, decompress in _DECOMPRESS:
+        if data.startswith(magic):
+            data = decompress(data)
+            break
+    return _parse_stream(io.BytesIO(data), db)
+
+
+def _parse_stream(f: BinaryIO, db: Optional[ClauseDB]) -> Tuple[ClauseDB, int, int]:
+    if db is None:
+        db = ClauseDB()
+    first = len(db)
+    header = [None, None]  # Declared variables and clauses
+    pending = []  # Literals of a clause not yet terminated
+    rest = b""  # Incomplete last line of the previous chunk
+
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            block, rest = rest, b""
+        else:
+            cut = chunk.rfind(b"\n") + 1
+            if cut == 0:
+                rest += chunk
+                continue
+            block, rest = rest + chunk[:cut], chunk[cut:]
+
+        done = False
+        if b"c" in block or b"p" in block or b"%" in block:
+            block, done = _strip_lines(block, header)
+        pending = _add_clauses(db, pending, block.split())
+
+        if done or not chunk:
+            break
+
+    if pending:
+        # A final clause missing its terminating 0
+        pending.append(END)
+        db.add_terminated(pending)
+
+    num_vars, num_clauses = header
+    if num_vars is None:
+        num_vars, num_clauses = 0, len(db) - first
+    return db, max(num_vars, db.max_var), num_clauses
+
+
+def _strip_lines(block: bytes, header: list) -> Tuple[bytes, bool]:
+    """Drop comment and problem lines; the flag is set at a '%' end marker"""
+    kept = []
+    done = False
+    for line in block.split(b"\n"):
+        token = line.lstrip()[:1]
+        if token == b"c":
+            continue
+        if token == b"p":
+            fields = line.split()
+            if len(fields) != 4 or fields[1] != b"cnf":
+                raise DimacsError(f"Bad problem line: {line.decode(errors='replace').strip()}")
+            header[0] = int(fields[2])
+            header[1] = int(fields[3])
+            continue
+        if token == b"%":
+            done = True
+            break
+        kept.append(line)
+    return b"\n".join(kept), done
+
+
+def _add_clauses(db: ClauseDB, pending: List[int], tokens: List[bytes]) -> List[int]:
+    """
+    Add every clause terminated in pending + tokens; pending and the returned
+    tail are the encoded literals of a clause still waiting for its 0
+    """
+    # Encode in one pass over the C-level int conversion; 0 becomes END
+    try:
+        codes = pending + [lit + lit if lit > 0 else 1 - lit - lit for lit in map(int, tokens)]
+    except ValueError as e:
+        raise DimacsError(f"Bad literal: {e}") from None
+
+    cut = len(codes)
+    while cut > 0 and codes[cut - 1] != END:
+        cut -= 1
+    tail = codes[cut:]
+    del codes[cut:]
+    db.add_terminated(codes)
+    return tail
+
+
+def binary_cnf(clauses: Iterable[Iterable[int]]) -> bytes:
+    """Encode DIMACS clauses as a binary CNF payload"""
+    data = bytearray()
+    for clause in clauses:
+        for lit in clause:
+            code = encode(lit)
+            while code > 0x7f:
+                data.append(code & 0x7f | 0x80)
+                code >>= 7
+            data.append(code)
+        data.append(0)
+    return bytes(data)
+
+
+def parse_binary_cnf(data: bytes, db: Optional[ClauseDB] = None) -> Tuple[ClauseDB, int, int]:
+    """
+    Decode a binary CNF payload into a clause database. Returns the database,
+    the largest variable and the number of clauses read.
+    """
+    if db is None:
+        db = ClauseDB()
+    first = len(db)
+    if not data:
+        return db, db.max_var, 0
+
+    if data[-1] != 0:
+        raise DimacsError("Binary CNF does not end with a clause terminator")
+    if max(data) < 0x80:
+        # Every literal fits in one byte
+        if END in data:
+            raise DimacsError("Binary CNF uses variable 0")
+        codes = list(data.translate(_BINARY_END))
+    else:
+        codes = []
+        code = 0
+        shift = 0
+        for byte in data:
+            code |= (byte & 0x7f) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            if code == END:
+                raise DimacsError("Binary CNF uses variable 0")
+            codes.append(code or END)
+            code = 0
+            shift = 0
+    db.add_terminated(codes)
+    return db, db.max_var, len(db) - first
@@ -0,0 +1,29 @@
+"""
+CNF formulas and file loading
+"""
+
+from typing import List, Union
+
+from .clausedb import ClauseDB
+from .dimacs import parse_dimacs
+from .literals import UNASSIGNED
+
+
+class CNFFormula:
+    """Represents a CNF formula"""
+
+    def __init__(self, num_vars: int, clauses: Union[ClauseDB, List[List[int]]]):
+        if not isinstance(clauses, ClauseDB):
+            db = ClauseDB()
+            for clause in clauses:
+                db.add(clause)
+            clauses = db
+        self.clauses = clauses  # Encoded clause literals in one flat buffer
+        self.num_vars = max(num_vars, self.clauses.max_var)
+        self.assignment = bytearray([UNASSIGNED]) * (self.num_vars + 1)  # Variable -> FALSE/TRUE/UNASSIGNED
+
+
+def parse_cnf(filename: str) -> CNFFormula:
+    """Parse DIMACS CNF file, plain or gzip/xz/bzip2 compressed"""
+    clauses, num_vars, num_clauses = parse_dimacs(filename)
+    return CNFFormula(num_vars, clauses)
@@ -0,0 +1,103 @@
+"""
+Indexed binary max-heap of variables
+
+Variables are ordered by an external score array that the caller owns and
+mutates. The heap keeps each variable's position, so a variable whose score
+changed can be sifted in O(log n) instead of rebuilding the queue.
+"""
+
+from typing import List
+
+
+class VarHeap:
+    """Priority queue of variables keyed on scores[var], largest first"""
+
+    def __init__(self, scores: List[float]):
+        self.scores = scores
+        self.heap = []
+        self.position = [-1] * len(scores)  # Variable -> index in heap, -1 if absent
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, var: int) -> bool:
+        return self.position[var] >= 0
+
+    def grow(self):
+        """Track the variables the caller appended to the score array"""
+        self.position.extend([-1] * (len(self.scores) - len(self.position)))
+
+    def push(self, var: int):
+        if self.position[var] >= 0:
+            return
+        self.position[var] = len(self.heap)
+        self.heap.append(var)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self) -> int:
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.position[top] = -1
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return top
+
+    def increase(self, var: int):
+        """Restore order after scores[var] grew"""
+        if self.position[var] >= 0:
+            self._sift_up(self.position[var])
+
+    def decrease(self, var: int):
+        """Restore order after scores[var] shrank"""
+        if self.position[var] >= 0:
+            self._sift_down(self.position[var])
+
+    def update(self, var: int):
+        """Restore order after scores[var] changed in either direction"""
+        if self.position[var] >= 0:
+            self._sift_down(self._sift_up(self.position[var]))
+
+    def _sift_up(self, i: int) -> int:
+        heap = self.heap
+        position = self.position
+        scores = self.scores
+        var = heap[i]
+        score = scores[var]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_var = heap[parent]
+            if scores[parent_var] >= score:
+                break
+            heap[i] = parent_var
+            position[parent_var] = i
+            i = parent
+        heap[i] = var
+        position[var] = i
+        return i
+
+    def _sift_down(self, i: int) -> int:
+        heap = self.heap
+        position = self.position
+        scores = self.scores
+        size = len(heap)
+        var = heap[i]
+        score = scores[var]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and scores[heap[right]] > scores[heap[child]]:
+                child = right
+            child_var = heap[child]
+            if scores[child_var] <= score:
+                break
+            heap[i] = child_var
+            position[child_var] = i
+            i = child
+        heap[i] = var
+        position[var] = i
+        return i
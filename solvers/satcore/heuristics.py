@@ -0,0 +1,171 @@
+"""
+Decision heuristics
+
+A heuristic picks the next decision variable and its polarity, and is told
+about conflicts, backtracks and variables added to the formula so it can
+keep its scores up to date incrementally. Heuristics register under the name
+used for them on the command line.
+
+on_setup hands a heuristic the caller's OccurrenceCounts, which the caller
+keeps in step with its trail. BOHM scores on those instead of keeping a
+second copy that every assignment would have to update as well.
+"""
+
+from typing import List, Optional
+
+from .formula import CNFFormula
+from .heap import VarHeap
+from .literals import UNASSIGNED
+from .occurrence import OccurrenceCounts
+from .phase import PhaseSelector
+
+HEURISTICS = {}  # Name -> heuristic class
+
+
+def register_heuristic(name: str):
+    """Class decorator adding a heuristic to HEURISTICS under name"""
+    def register(cls):
+        HEURISTICS[name] = cls
+        return cls
+    return register
+
+
+class HeapHeuristic:
+    """
+    Decision order shared by the scoring heuristics: a VarHeap over
+    self.scores, built on the first decision. Subclasses fill in the initial
+    scores and keep them up to date.
+    """
+
+    def __init__(self, phases: PhaseSelector):
+        self.scores = []  # Variable -> score
+        self.order = None  # Heap of candidate variables keyed on scores
+        self.phases = phases
+        self.initialized = False
+
+    def select_variable(self, formula: CNFFormula) -> Optional[int]:
+        if not self.initialized:
+            self._initialize(formula)
+        self._refresh(formula)
+
+        # Assigned variables are dropped lazily; backtracking re-inserts them
+        while len(self.order) > 0:
+            var = self.order.pop()
+            if formula.assignment[var] == UNASSIGNED:
+                return var
+
+        return None
+
+    def on_setup(self, formula: CNFFormula, counts: OccurrenceCounts):
+        pass
+
+    def on_conflict(self, clause: List[int]):
+        pass
+
+    def on_backtrack(self, undone: List[int]):
+        self.phases.save(undone)
+        if not self.initialized:
+            return
+        for lit in undone:
+            self.order.push(lit >> 1)
+
+    def on_new_variables(self, formula: CNFFormula):
+        if not self.initialized:
+            return
+        first = len(self.scores)
+        self.scores.extend(self._initial_scores(formula, first))
+        self.order.grow()
+        for var in range(first, formula.num_vars + 1):
+            self.order.push(var)
+
+    def _initialize(self, formula: CNFFormula):
+        self.scores = self._initial_scores(formula, 0)
+        self.order = VarHeap(self.scores)
+        for var in range(1, formula.num_vars + 1):
+            self.order.push(var)
+        self.initialized = True
+
+    def _initial_scores(self, formula: CNFFormula, first: int) -> List[float]:
+        """Scores of variables first..num_vars before any decision"""
+        return [0] * (formula.num_vars + 1 - first)
+
+    def _refresh(self, formula: CNFFormula):
+        """Bring scores up to date before a decision"""
+
+
+@register_heuristic("vsids")
+class VSIDSHeuristic(HeapHeuristic):
+    """Variable State Independent Decaying Sum - focuses on recent conflicts"""
+
+    def __init__(self, decay_factor: float = 0.95, polarity: str = "saved",
+                 seed: Optional[int] = None):
+        super().__init__(PhaseSelector(polarity, seed=seed))
+        self.name = "VSIDS"
+        self.decay_factor = decay_factor
+        self.bump_value = 1.0
+
+    def select_polarity(self, formula: CNFFormula, var: int) -> bool:
+        return self.phases.choose(formula, var)
+
+    def on_conflict(self, clause: List[int]):
+        if not self.initialized:
+            return
+        for lit in clause:
+            var = lit >> 1
+            self.scores[var] += self.bump_value
+            self.order.increase(var)
+        self._decay_activities()
+
+    def _initial_scores(self, formula: CNFFormula, first: int) -> List[float]:
+        activity = [0.0] * (formula.num_vars + 1 - first)
+        if first == 0:
+            for lit in formula.clauses.lits:
+                activity[lit >> 1] = 0.1
+        return activity
+
+    def _decay_activities(self):
+        self.bump_value /= self.decay_factor
+        if self.bump_value > 1e100:
+            # Uniform scaling keeps the heap order intact
+            for var in range(len(self.scores)):
+                self.scores[var] *= 1e-100
+            self.bump_value *= 1e-100
+
+
+@register_heuristic("bohm")
+class BOHMHeuristic(HeapHeuristic):
+    """BOHM - prioritizes variables in smallest clauses with weighted scoring"""
+
+    def __init__(self, alpha: int = 1, beta: int = 2, polarity: str = "saved",
+                 seed: Optional[int] = None):
+        super().__init__(PhaseSelector(polarity, alpha, beta, seed))
+        self.name = "BOHM"
+        self.alpha = alpha
+        self.beta = beta
+        self.counts = None  # The caller's occurrence counts, from on_setup
+
+    def select_polarity(self, formula: CNFFormula, var: int) -> bool:
+        return self.phases.choose(formula, var, self.counts)
+
+    def on_setup(self, formula: CNFFormula, counts: OccurrenceCounts):
+        self.counts = counts
+        self.initialized = False
+
+    def _refresh(self, formula: CNFFormula):
+        """Rescore the variables whose counts changed since the last call; clears dirty"""
+        counts = self.counts
+        weighted = counts.weighted
+        scores = self.scores
+        order = self.order
+        alpha = self.alpha
+        beta = self.beta
+        for var in counts.dirty:
+            score = alpha * weighted[2 * var] + beta * weighted[2 * var + 1]
+            old = scores[var]
+            if score > old:
+                scores[var] = score
+                order.increase(var)
+            elif score < old:
+                scores[var] = score
+                order.decrease(var)
+        counts.dirty.clear()
@@ -0,0 +1,114 @@
+"""
+Incremental solving under assumptions
+
+IncrementalSolver answers a sequence of related queries on one growing
+formula, in the manner of the IPASIR interface:
+
+    solver = make_incremental_solver("restart", "vsids")
+    for clause in base_clauses:
+        solver.add_clause(clause)
+    result, model = solver.solve(assumptions=[3, -7])
+    if result is False:
+        core = solver.failed_assumptions()
+
+Assumptions hold for one call only. The CDCL search decides them first, one
+decision level each, so every learned clause is implied by the clauses alone
+and stays valid for later calls. The clause database with its watch lists,
+the learned clauses, the level-0 assignments and the heuristic's scores all
+carry over. Clauses added between calls are simplified against level 0
+first. Variables may appear at any time; every per-variable array grows in
+place.
+
+Pure literal elimination is off. A pure literal is only safe to assign for
+the clauses seen so far, and it would look like an assumption to the
+failed-assumption analysis.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .formula import CNFFormula
+from .heuristics import HEURISTICS
+from .literals import UNASSIGNED, decode, encode
+from .solver import DPLLSolver
+from .strategies import STRATEGIES
+
+
+class IncrementalSolver(DPLLSolver):
+    """CDCL solver keeping its clauses, learned clauses and scores across solve calls"""
+
+    def __init__(self, strategy, heuristic):
+        super().__init__(strategy, heuristic, learning=True)
+        self.pure_mode = "off"
+        self.formula = CNFFormula(0, [])
+        self.inconsistent = False  # The clauses alone are unsatisfiable
+
+    def add_clause(self, clause: Iterable[int]):
+        """Add a DIMACS clause for this and every later solve"""
+        lits = list(dict.fromkeys(encode(lit) for lit in clause))
+        self._reserve(max((lit >> 1 for lit in lits), default=0))
+        if self.propagator is None:
+            self.formula.clauses.add_encoded(lits)  # Loaded by the first solve
+        elif not self.inconsistent and not self._add_clause(lits, irredundant=True):
+            self.inconsistent = True
+
+    def solve(self, assumptions: Iterable[int] = ()) -> Tuple[Optional[bool], Dict[int, bool]]:
+        """
+        Solve the clauses added so far with DIMACS literals assumed true.
+        (True, model), (False, {}) with the culprits in failed_assumptions(),
+        or (None, {}) when the budget ran out first.
+        """
+        self.assumptions = [encode(lit) for lit in assumptions]
+        self._reserve(max((lit >> 1 for lit in self.assumptions), default=0))
+        return super().solve(self.formula)
+
+    def failed_assumptions(self) -> List[int]:
+        """
+        Assumptions of the last solve that are unsatisfiable together with
+        the clauses, as DIMACS literals. Empty if the last solve was not
+        unsatisfiable or the clauses are unsatisfiable on their own.
+        """
+        return [decode(lit) for lit in self.failed]
+
+    def _solve(self, formula: CNFFormula) -> Tuple[Optional[bool], Dict[int, bool]]:
+        self._reset_counters()
+        self.strategy.reset()  # Counters start from 0, so does the restart schedule
+        self.failed = []
+        if self.propagator is None:
+            start = time.perf_counter()
+            if not self._setup(formula):
+                self.inconsistent = True
+            self.stats.times["setup"] += time.perf_counter() - start
+        if self.inconsistent:
+            return False, {}
+
+        result = self._cdcl(formula)
+        if result is False and not self.failed:
+            self.inconsistent = True  # Conflict at level 0
+            return False, {}
+        model = self._get_model(formula) if result else {}
+        self._backtrack(0)
+        return result, model
+
+    def _reserve(self, num_vars: int):
+        """Grow every per-variable array to cover variables up to num_vars"""
+        formula = self.formula
+        if num_vars <= formula.num_vars:
+            return
+        formula.assignment.extend(bytearray([UNASSIGNED]) * (num_vars - formula.num_vars))
+        formula.num_vars = num_vars
+        if self.propagator is not None:
+            self.trail.grow()
+            self.propagator.grow(num_vars)
+            self.occurrences.grow(num_vars)
+        self.heuristic.on_new_variables(formula)
+
+
+def make_incremental_solver(strategy: str = "restart", heuristic: str = "vsids",
+                            **options) -> IncrementalSolver:
+    """make_solver for an IncrementalSolver; options go to the heuristic's constructor"""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    return IncrementalSolver(STRATEGIES[strategy](), HEURISTICS[heuristic](**options))
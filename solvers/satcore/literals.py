@@ -0,0 +1,25 @@
+"""
+Literal encoding and assignment values
+
+Inside the engine a literal is the integer 2 * var + sign, with sign 1 for a
+negated variable, so negation is lit ^ 1 and the variable is lit >> 1.
+Assignments are bytes per variable: FALSE, TRUE or UNASSIGNED. XOR-ing a
+variable's value with the literal's sign bit gives the literal's value, and
+anything >= UNASSIGNED means unassigned.
+"""
+
+FALSE = 0
+TRUE = 1
+UNASSIGNED = 2
+
+NO_REASON = -1  # Reason of decisions and of literals set outside propagation
+
+
+def encode(lit: int) -> int:
+    """DIMACS literal -> engine literal"""
+    return (lit << 1) if lit > 0 else ((-lit) << 1) | 1
+
+
+def decode(lit: int) -> int:
+    """Engine literal -> DIMACS literal"""
+    return -(lit >> 1) if lit & 1 else lit >> 1
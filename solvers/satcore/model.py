@@ -0,0 +1,130 @@
+"""
+Models: output, parsing and verification
+
+Satisfying assignments are printed SAT-competition style, as `v` lines of
+DIMACS literals closed by a 0. check_model verifies a model against a
+clause database in one pass over the flat literal buffer: with NumPy the
+truth value of every literal is gathered at once and reduced per clause,
+without it a plain loop computes the same thing.
+"""
+
+import argparse
+import sys
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional; the pure-Python loop gives the same answer
+    np = None
+
+from .clausedb import ClauseDB
+from .dimacs import parse_dimacs
+from .proof import check_proof_file
+
+LINE_WIDTH = 78  # Longest `v` line written
+
+
+def model_lines(model: Dict[int, bool], num_vars: int) -> List[str]:
+    """`v` lines for a model over variables 1..num_vars; variables it leaves open are printed false"""
+    lines = []
+    line = "v"
+    for var in range(1, num_vars + 1):
+        word = str(var) if model.get(var, False) else str(-var)
+        if len(line) + 1 + len(word) > LINE_WIDTH:
+            lines.append(line)
+            line = "v"
+        line += " " + word
+    lines.append(line + " 0")
+    return lines
+
+
+def parse_model(lines: Iterable[str]) -> Dict[int, bool]:
+    """The assignment given by the `v` lines of solver output; other lines are ignored"""
+    model = {}
+    for line in lines:
+        if not line.startswith("v"):
+            continue
+        for word in line[1:].split():
+            lit = int(word)
+            if lit != 0:
+                model[abs(lit)] = lit > 0
+    return model
+
+
+def _truth_table(db: ClauseDB, model: Dict[int, bool]) -> bytearray:
+    """Encoded literal -> 1 if the model makes it true; open variables make neither literal true"""
+    num_vars = max([db.max_var] + list(model))
+    truth = bytearray(2 * num_vars + 2)
+    for var, value in model.items():
+        truth[2 * var + (not value)] = 1
+    return truth
+
+
+def falsified_clauses(db: ClauseDB, model: Dict[int, bool]) -> List[int]:
+    """Indices of the clauses the model does not satisfy"""
+    truth = _truth_table(db, model)
+    if np is not None and len(db.lits):
+        sizes = np.frombuffer(db.size, dtype=np.int32)
+        nonempty = np.flatnonzero(sizes)
+        sat = np.frombuffer(truth, dtype=np.uint8)[np.frombuffer(db.lits, dtype=np.int32)]
+        starts = np.frombuffer(db.start, dtype=np.int64)[nonempty]
+        satisfied = np.zeros(len(sizes), dtype=np.uint8)
+        satisfied[nonempty] = np.maximum.reduceat(sat, starts)
+        return np.flatnonzero(satisfied == 0).tolist()
+
+    lits = db.lits
+    start = db.start
+    falsified = []
+    for index, size in enumerate(db.size):
+        base = start[index]
+        if not any(truth[lit] for lit in lits[base:base + size]):
+            falsified.append(index)
+    return falsified
+
+
+def check_model(db: ClauseDB, model: Dict[int, bool]) -> bool:
+    """True if the model satisfies every clause of db"""
+    return not falsified_clauses(db, model)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Check a solver's model or DRAT proof against a CNF formula")
+    parser.add_argument("cnf_file", help="DIMACS CNF file, optionally gzip/xz/bzip2 compressed")
+    parser.add_argument("output", nargs="?", help="solver output with `v` lines (default: stdin)")
+    parser.add_argument("--proof", metavar="PATH",
+                        help="check this DRAT proof of unsatisfiability instead of a model")
+    args = parser.parse_args(argv)
+
+    if args.proof:
+        if check_proof_file(args.cnf_file, args.proof):
+            print("verified")
+            return
+        print("wrong")
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output) as f:
+            lines = f.read().splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+
+    results = [line.strip() for line in lines if line.strip() in ("sat", "unsat", "unknown")]
+    if results and results[0] != "sat":
+        print(f"c nothing to check: solver answered {results[0]}")
+        return
+
+    model = parse_model(lines)
+    if not model:
+        print("c no model in the solver output")
+        sys.exit(1)
+
+    db, num_vars, num_clauses = parse_dimacs(args.cnf_file)
+    falsified = falsified_clauses(db, model)
+    if falsified:
+        for index in falsified[:10]:
+            print("c falsified: " + " ".join(map(str, db.clause(index))) + " 0")
+        print(f"c {len(falsified)} of {len(db)} clauses falsified")
+        print("wrong")
+        sys.exit(1)
+    print(f"c all {len(db)} clauses satisfied")
+    print("verified")
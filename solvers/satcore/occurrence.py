@@ -0,0 +1,234 @@
+"""
+Incremental literal occurrence counts
+
+For every literal, counts how many unsatisfied clauses it occurs free in,
+and the same occurrences weighted by the BOHM weight of the number of free
+literals those clauses have left. Each assignment only visits the clauses
+containing the assigned variable and adjusts both totals by the change, and
+is undone in reverse order on backtrack, so the counts never need a full
+rescan. A pure literal is visible in O(1) as soon as the count of its
+negation drops to zero; such variables are collected as pure candidates.
+The variables whose weighted totals changed at all are collected separately
+in dirty, for a heuristic scoring on them.
+
+Only registered clauses are counted: the clauses in the database at
+construction and those passed to register() later. A solver leaves its
+learned clauses out. They are implied by the others, so they decide neither
+satisfaction nor purity, and long learned clauses would make every
+assignment walk far more clauses than the formula has.
+"""
+
+from array import array
+from typing import List
+
+from .clausedb import ClauseDB
+from .literals import TRUE, UNASSIGNED
+
+BUCKETS = 6  # Free lengths 1-5 get their own weight; longer clauses share the last
+
+
+def length_weight(length: int) -> int:
+    """BOHM weight of a clause with length free literals: 2^(5 - length), at least 1"""
+    return 2 ** (5 - length) if length <= 5 else 1
+
+
+# min(free length, BUCKETS) -> weight; a clause with no free literal has none to weigh
+_WEIGHTS = (0,) + tuple(length_weight(length) for length in range(1, BUCKETS + 1))
+
+
+class OccurrenceCounts:
+    """Per-clause true/free counters and plain and weighted per-literal free occurrence counts"""
+
+    def __init__(self, db: ClauseDB, num_vars: int):
+        self.db = db
+        self.num_vars = num_vars
+        self.value = bytearray([UNASSIGNED]) * (num_vars + 1)  # Assignment as applied to the counts
+        self.applied = []  # Applied literals, oldest first
+        self.true_count = array('i')  # Clause -> number of true literals
+        self.free_count = array('i')  # Clause -> number of unassigned literals
+        self.occurs = [array('i') for _ in range(2 * num_vars + 2)]  # Literal -> clauses
+        # Literal -> free occurrences in unsatisfied clauses, plain and with
+        # each weighted by length_weight of its clause's free length
+        self.active = array('i', [0]) * (2 * num_vars + 2)
+        self.weighted = array('i', [0]) * (2 * num_vars + 2)
+        self.clauses = 0  # Number of registered clauses
+        self.satisfied = 0  # Number of registered clauses with a true literal
+        self.dirty = set()  # Variables whose weighted counts changed since the caller cleared this
+        self.candidates = set(range(1, num_vars + 1))  # Variables pure_literals has to examine
+        for index in range(len(db)):
+            self.register(index)
+
+    def grow(self, num_vars: int):
+        """Make room for variables up to num_vars"""
+        extra = num_vars - self.num_vars
+        if extra <= 0:
+            return
+        self.value.extend(bytearray([UNASSIGNED]) * extra)
+        self.occurs.extend(array('i') for _ in range(2 * extra))
+        self.active.extend(array('i', [0]) * (2 * extra))
+        self.weighted.extend(array('i', [0]) * (2 * extra))
+        self.candidates.update(range(self.num_vars + 1, num_vars + 1))
+        self.num_vars = num_vars
+
+    def register(self, index: int):
+        """Count database clause index from now on, under the assignment applied so far"""
+        missing = index + 1 - len(self.true_count)
+        if missing > 0:  # Unregistered clauses before it keep zeros that nothing reads
+            self.true_count.extend(array('i', [0]) * missing)
+            self.free_count.extend(array('i', [0]) * missing)
+
+        value = self.value
+        lits = self.db.literals(index)
+
+        true = 0
+        free = 0
+        for lit in lits:
+            self.occurs[lit].append(index)
+            var_value = value[lit >> 1]
+            if var_value == UNASSIGNED:
+                free += 1
+            elif var_value ^ (lit & 1) == TRUE:
+                true += 1
+
+        self.true_count[index] = true
+        self.free_count[index] = free
+        self.clauses += 1
+
+        if true > 0:
+            self.satisfied += 1
+        else:
+            weight = _WEIGHTS[min(free, BUCKETS)]
+            for lit in lits:
+                if value[lit >> 1] == UNASSIGNED:
+                    self.active[lit] += 1
+                    self.weighted[lit] += weight
+                    self.dirty.add(lit >> 1)
+
+    def assign(self, lit: int):
+        var = lit >> 1
+        value = self.value
+        db_lits = self.db.lits
+        start = self.db.start
+        size = self.db.size
+        true_count = self.true_count
+        free_count = self.free_count
+        active = self.active
+        weighted = self.weighted
+        dirty = self.dirty
+        candidates = self.candidates
+
+        # Clauses containing lit become satisfied
+        for index in self.occurs[lit]:
+            if true_count[index] == 0:
+                weight = _WEIGHTS[min(free_count[index], BUCKETS)]
+                base = start[index]
+                for k in range(base, base + size[index]):
+                    other = db_lits[k]
+                    if value[other >> 1] == UNASSIGNED:
+                        active[other] -= 1
+                        weighted[other] -= weight
+                        if not active[other]:
+                            candidates.add(other >> 1)
+                        dirty.add(other >> 1)
+                self.satisfied += 1
+            true_count[index] += 1
+            free_count[index] -= 1
+
+        # Clauses containing the negation lose a free literal
+        for index in self.occurs[lit ^ 1]:
+            free = free_count[index]
+            if true_count[index] == 0:
+                weight = _WEIGHTS[min(free, BUCKETS)]
+                shift = _WEIGHTS[min(free - 1, BUCKETS)] - weight
+                if shift:  # Else the clause stays at weight 1 and only lit ^ 1 changes
+                    base = start[index]
+                    for k in range(base, base + size[index]):
+                        other = db_lits[k]
+                        other_var = other >> 1
+                        if other_var != var and value[other_var] == UNASSIGNED:
+                            weighted[other] += shift
+                            dirty.add(other_var)
+                active[lit ^ 1] -= 1
+                weighted[lit ^ 1] -= weight
+                dirty.add(var)
+            free_count[index] = free - 1
+
+        value[var] = (lit & 1) ^ 1
+        self.applied.append(lit)
+
+    def unassign(self) -> int:
+        """Undo the most recently applied literal and return it"""
+        lit = self.applied.pop()
+        var = lit >> 1
+        value = self.value
+        db_lits = self.db.lits
+        start = self.db.start
+        size = self.db.size
+        true_count = self.true_count
+        free_count = self.free_count
+        active = self.active
+        weighted = self.weighted
+        dirty = self.dirty
+
+        value[var] = UNASSIGNED
+        self.candidates.add(var)
+
+        for index in self.occurs[lit ^ 1]:
+            free = free_count[index] + 1
+            free_count[index] = free
+            if true_count[index] == 0:
+                weight = _WEIGHTS[min(free, BUCKETS)]
+                shift = weight - _WEIGHTS[min(free - 1, BUCKETS)]
+                if shift:
+                    base = start[index]
+                    for k in range(base, base + size[index]):
+                        other = db_lits[k]
+                        other_var = other >> 1
+                        if other_var != var and value[other_var] == UNASSIGNED:
+                            weighted[other] += shift
+                            dirty.add(other_var)
+                active[lit ^ 1] += 1
+                weighted[lit ^ 1] += weight
+                dirty.add(var)
+
+        for index in self.occurs[lit]:
+            true = true_count[index] - 1
+            true_count[index] = true
+            free = free_count[index] + 1
+            free_count[index] = free
+            if true == 0:
+                weight = _WEIGHTS[min(free, BUCKETS)]
+                base = start[index]
+                for k in range(base, base + size[index]):
+                    other = db_lits[k]
+                    if value[other >> 1] == UNASSIGNED:
+                        active[other] += 1
+                        weighted[other] += weight
+                        dirty.add(other >> 1)
+                self.satisfied -= 1
+
+        return lit
+
+    def pure_literals(self, assignment: bytearray) -> List[int]:
+        """
+        Free literals whose negation no longer occurs free in an unsatisfied
+        clause. Only the candidates are examined: the variables unassigned,
+        or with a literal count dropped to zero, since the last call.
+        """
+        active = self.active
+        pure = []
+        for var in self.candidates:
+            if assignment[var] != UNASSIGNED:
+                continue
+            positive = active[2 * var]
+            negative = active[2 * var + 1]
+            if positive and not negative:
+                pure.append(2 * var)
+            elif negative and not positive:
+                pure.append(2 * var + 1)
+        self.candidates.clear()
+        return pure
+
+    def score(self, lit: int) -> int:
+        """Free occurrences of lit in unsatisfied clauses, weighted by free length"""
+        return self.weighted[lit]
@@ -0,0 +1,85 @@
+"""
+Decision polarity selection
+
+saved   - phase saving: the value the variable had when it was last unassigned
+          (True before it was ever assigned)
+false   - always try False first
+random  - fair coin from a seeded generator
+bohm    - the polarity contributing more to the BOHM score, i.e. the larger of
+          alpha * weighted positive and beta * weighted negative occurrences
+"""
+
+import random
+from typing import List, Optional
+from collections import defaultdict
+
+from .literals import UNASSIGNED, TRUE
+from .occurrence import OccurrenceCounts, length_weight
+
+POLARITY_MODES = ("saved", "false", "random", "bohm")
+
+
+class PhaseSelector:
+    """Chooses the value a decision variable is tried with first"""
+
+    def __init__(self, mode: str = "saved", alpha: int = 1, beta: int = 2,
+                 seed: Optional[int] = None):
+        if mode not in POLARITY_MODES:
+            raise ValueError(f"Unknown polarity mode: {mode}")
+        self.mode = mode
+        self.alpha = alpha
+        self.beta = beta
+        self.saved = {}  # Variable -> value it had when last unassigned
+        self.rng = random.Random(seed)
+        self.occurs = defaultdict(list)  # Literal -> clause indices, for BOHM polarity without counts
+        self.registered = 0  # Clauses of the formula already in self.occurs
+
+    def save(self, undone: List[int]):
+        """Record the values of literals being unassigned by a backtrack"""
+        saved = self.saved
+        for lit in undone:
+            saved[lit >> 1] = not (lit & 1)
+
+    def choose(self, formula, var: int, counts: Optional[OccurrenceCounts] = None) -> bool:
+        mode = self.mode
+        if mode == "saved":
+            return self.saved.get(var, True)
+        if mode == "false":
+            return False
+        if mode == "random":
+            return self.rng.random() < 0.5
+
+        if counts is not None:
+            positive = counts.score(2 * var)
+            negative = counts.score(2 * var + 1)
+        else:
+            positive, negative = self._scan(formula, var)
+        return self.alpha * positive >= self.beta * negative
+
+    def _scan(self, formula, var: int):
+        """Weighted occurrences of var and -var, from occurrence lists built on first use"""
+        db = formula.clauses
+        occurs = self.occurs
+        for index in range(self.registered, len(db)):
+            for lit in db.literals(index):
+                occurs[lit].append(index)
+        self.registered = len(db)
+
+        assignment = formula.assignment
+        totals = []
+        for lit in (2 * var, 2 * var + 1):
+            total = 0
+            for index in occurs[lit]:
+                free = 0
+                satisfied = False
+                for other in db.literals(index):
+                    value = assignment[other >> 1]
+                    if value == UNASSIGNED:
+                        free += 1
+                    elif value ^ (other & 1) == TRUE:
+                        satisfied = True
+                        break
+                if not satisfied:
+                    total += length_weight(free)
+            totals.append(total)
+        return totals[0], totals[1]
@@ -0,0 +1,148 @@
+"""
+Parallel portfolio
+
+Which configuration wins changes from formula to formula, so the portfolio
+runs several of them on the same formula in separate processes and keeps
+the first definitive answer; the others are killed. Latency becomes the
+minimum over the configurations that got a core.
+
+A configuration is a dict of make_solver arguments: strategy, heuristic and
+optionally learning, polarity and seed.
+
+With share=True the workers also cooperate: each publishes its short or
+low-LBD learned clauses to a shared ClauseRing and imports the others' at
+its restarts, so a single hard instance can profit from several cores.
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .formula import CNFFormula, parse_cnf
+from .model import model_lines
+from .sharing import ClauseRing, ClauseSharing
+from .solver import make_solver
+
+DEFAULT_CONFIGS = [
+    {"strategy": "chronological", "heuristic": "vsids"},
+    {"strategy": "chronological", "heuristic": "bohm"},
+    {"strategy": "restart", "heuristic": "vsids"},
+    {"strategy": "restart", "heuristic": "bohm"},
+] + [
+    {"strategy": "restart", "heuristic": "vsids", "polarity": "random", "seed": seed}
+    for seed in (1, 2, 3, 4)
+]
+
+
+def describe(config: dict) -> str:
+    """Short label such as restart+vsids/random#3"""
+    label = f"{config['strategy']}+{config['heuristic']}"
+    if "polarity" in config:
+        label += f"/{config['polarity']}"
+    if "seed" in config:
+        label += f"#{config['seed']}"
+    return label
+
+
+def _run(index: int, config: dict, formula: CNFFormula, results: multiprocessing.Queue,
+         sharing: Optional[ClauseSharing]):
+    options = dict(config)
+    strategy = options.pop("strategy")
+    heuristic = options.pop("heuristic")
+    learning = options.pop("learning", True)
+    try:
+        solver = make_solver(strategy, heuristic, learning, **options)
+        solver.sharing = sharing
+        result, model = solver.solve(formula)
+    except Exception:
+        result, model = None, {}
+    results.put((index, result, model))
+
+
+def solve_portfolio(formula: CNFFormula, configs: Optional[List[dict]] = None,
+                    workers: Optional[int] = None, timeout: Optional[float] = None,
+                    share: bool = False, max_length: int = 8,
+                    max_lbd: int = 2) -> Tuple[Optional[bool], Dict[int, bool], Optional[dict]]:
+    """
+    Race configurations on formula, at most workers at a time (default: one
+    per core); a configuration that ends without an answer frees its slot for
+    the next one. Returns the result (None if every run failed or the timeout
+    passed), its model and the configuration that produced it.
+    With share, learned clauses of at most max_length literals or max_lbd
+    decision levels are exchanged between the runs.
+    """
+    configs = list(configs or DEFAULT_CONFIGS)
+    workers = workers or os.cpu_count() or 1
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    ring = ClauseRing() if share else None
+    results = multiprocessing.Queue()
+    waiting = list(enumerate(configs))
+    running = {}  # Config index -> process
+
+    try:
+        while waiting or running:
+            while waiting and len(running) < workers:
+                index, config = waiting.pop(0)
+                sharing = None if ring is None else ClauseSharing(ring, index, max_length, max_lbd)
+                process = multiprocessing.Process(target=_run,
+                                                  args=(index, config, formula, results, sharing),
+                                                  daemon=True)
+                process.start()
+                running[index] = process
+
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                index, result, model = results.get(timeout=wait)
+            except queue.Empty:
+                break
+
+            running.pop(index).join()
+            if result is not None:
+                return result, model, configs[index]
+
+        return None, {}, None
+    finally:
+        for process in running.values():
+            process.kill()
+        for process in running.values():
+            process.join()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Race solver configurations on one formula")
+    parser.add_argument("cnf_file", help="DIMACS CNF file, optionally gzip/xz/bzip2 compressed")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="configurations run at once (default: number of cores)")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds before giving up")
+    parser.add_argument("--share", action="store_true",
+                        help="exchange short learned clauses between the runs")
+    parser.add_argument("--share-length", type=int, default=8,
+                        help="share learned clauses with at most this many literals")
+    parser.add_argument("--share-lbd", type=int, default=2,
+                        help="share learned clauses spanning at most this many decision levels")
+    parser.add_argument("--model", action="store_true",
+                        help="print the satisfying assignment as `v` lines")
+    args = parser.parse_args(argv)
+
+    try:
+        formula = parse_cnf(args.cnf_file)
+        result, assignment, config = solve_portfolio(formula, workers=args.workers,
+                                                     timeout=args.timeout, share=args.share,
+                                                     max_length=args.share_length,
+                                                     max_lbd=args.share_lbd)
+    except Exception as e:
+        print("unknown")
+        sys.exit(1)
+
+    if result is None:
+        print("unknown")
+        return
+    print("sat" if result else "unsat")
+    print(f"c solved by {describe(config)}")
+    if result and args.model:
+        print("\n".join(model_lines(assignment, formula.num_vars)))
@@ -0,0 +1,236 @@
+"""
+Formula simplification before search
+
+Runs on DIMACS clauses held as sets, with occurrence lists per literal:
+
+- duplicate literals, duplicate clauses and tautologies are dropped on load
+- top-level unit propagation
+- backward subsumption and self-subsuming strengthening: each queued clause
+  C is checked against the clauses sharing the variable of its rarest
+  literal; D is deleted if C is a subset of it, or loses ~l if C with l
+  flipped is a subset of it
+- bounded variable elimination: a variable is resolved away when the
+  non-tautological resolvents are no more numerous than the clauses they
+  replace
+
+Every clause removed by unit propagation or elimination is pushed on a
+reconstruction stack together with the literal that can satisfy it.
+extend_model walks that stack backwards and flips a witness whenever its
+clause is not satisfied, which turns any model of the simplified formula
+into a model of the original one.
+
+With a proof writer, every resolvent and strengthened clause is logged as a
+DRAT addition and every removed clause, apart from units, as a deletion, so
+a proof of the simplified formula's unsatisfiability continues from the
+original formula.
+
+With a budget, subsumption and elimination stop between two clauses or
+variables once its clock or memory limit is reached. The formula simplified
+so far is as good an input as the finished one, and the search then stops
+at its first budget check.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from .formula import CNFFormula
+from .literals import encode
+
+RESOLVENT_LIMIT = 20  # Longest resolvent BVE will add
+ELIMINATION_LIMIT = 400  # Skip variables with more than this many resolution pairs
+SUBSUMPTION_LIMIT = 1000  # Skip subsumption candidates lists longer than this
+
+
+class Preprocessor:
+    """Simplifies a clause set and reconstructs full models afterwards"""
+
+    def __init__(self, num_vars: int, clauses: Iterable[List[int]], proof=None, budget=None):
+        self.num_vars = num_vars
+        self.proof = proof  # Optional satcore.proof.DratWriter
+        self.budget = budget  # Optional satcore.budget.Budget
+        self.clauses = []  # Clause index -> set of literals, None once removed
+        self.occurs = defaultdict(set)  # Literal -> indices of clauses containing it
+        self.units = []  # Literals to propagate
+        self.fixed = {}  # Variable -> value fixed at the top level
+        self.stack = []  # (witness literal, clause) pairs for model reconstruction
+        self.eliminated = set()
+        self.queue = []  # Clauses to use for subsumption
+        self.unsat = False
+        self.removed = 0
+        self.strengthened = 0
+
+        seen = set()
+        for clause in clauses:
+            lits = frozenset(clause)
+            if lits in seen or any(-lit in lits for lit in lits):
+                continue
+            seen.add(lits)
+            self._add(set(lits))
+
+    def run(self, eliminate: bool = True) -> Optional[bool]:
+        """Simplify to a fixpoint; returns False if the formula was refuted, None otherwise"""
+        self._propagate()
+        self._subsume()
+        if eliminate:
+            self._eliminate()
+        return False if self.unsat else None
+
+    def formula(self) -> CNFFormula:
+        """The simplified formula, over the original variable numbering"""
+        return CNFFormula(self.num_vars, [sorted(clause) for clause in self.clauses
+                                          if clause is not None])
+
+    def extend_model(self, model: Dict[int, bool]) -> Dict[int, bool]:
+        """Turn a model of the simplified formula into one of the original"""
+        # The walk needs a total assignment: a clause counted as unsatisfied
+        # only because a variable was left open would flip the wrong witness
+        model = {var: model.get(var, False) for var in range(1, self.num_vars + 1)}
+        for witness, lits in reversed(self.stack):
+            if not any(model.get(abs(lit)) == (lit > 0) for lit in lits):
+                model[abs(witness)] = witness > 0
+        return model
+
+    def _add(self, lits: set):
+        if not lits:
+            self.unsat = True
+            return
+        if len(lits) == 1:
+            self.units.append(next(iter(lits)))
+        index = len(self.clauses)
+        self.clauses.append(lits)
+        for lit in lits:
+            self.occurs[lit].add(index)
+        self.queue.append(index)
+
+    def _remove(self, index: int):
+        clause = self.clauses[index]
+        if self.proof is not None and len(clause) > 1:
+            self.proof.delete([encode(lit) for lit in clause])
+        for lit in clause:
+            self.occurs[lit].discard(index)
+        self.clauses[index] = None
+        self.removed += 1
+
+    def _strengthen(self, index: int, lit: int):
+        """Drop lit from a clause, which must stay implied by the formula"""
+        clause = self.clauses[index]
+        if self.proof is not None:
+            self.proof.add([encode(other) for other in clause if other != lit])
+            if len(clause) > 1:
+                self.proof.delete([encode(other) for other in clause])
+        clause.discard(lit)
+        self.occurs[lit].discard(index)
+        self.strengthened += 1
+        if not clause:
+            self.unsat = True
+        elif len(clause) == 1:
+            self.units.append(next(iter(clause)))
+        self.queue.append(index)
+
+    def _propagate(self):
+        while self.units and not self.unsat:
+            lit = self.units.pop()
+            var = abs(lit)
+            if var in self.fixed:
+                if self.fixed[var] != (lit > 0):
+                    self.unsat = True
+                continue
+            self.fixed[var] = lit > 0
+            self.stack.append((lit, [lit]))
+            for index in list(self.occurs[lit]):
+                self._remove(index)
+            for index in list(self.occurs[-lit]):
+                self._strengthen(index, -lit)
+
+    def _subsume(self):
+        clauses = self.clauses
+        occurs = self.occurs
+        while self.queue and not self.unsat:
+            if self._expired():
+                return
+            index = self.queue.pop()
+            clause = clauses[index]
+            if clause is None:
+                continue
+
+            pivot = min(clause, key=lambda lit: len(occurs[lit]) + len(occurs[-lit]))
+            if len(occurs[pivot]) + len(occurs[-pivot]) > SUBSUMPTION_LIMIT:
+                continue
+            for other in list(occurs[pivot] | occurs[-pivot]):
+                target = clauses[other]
+                if other == index or target is None or len(target) < len(clause):
+                    continue
+                missing = clause - target
+                if not missing:
+                    self._remove(other)
+                elif len(missing) == 1:
+                    lit = next(iter(missing))
+                    if -lit in target:
+                        self._strengthen(other, -lit)
+                if clauses[index] is None or self.unsat:
+                    break
+            self._propagate()
+
+    def _eliminate(self):
+        occurs = self.occurs
+        candidates = [var for var in range(1, self.num_vars + 1)
+                      if var not in self.fixed and (occurs[var] or occurs[-var])]
+        candidates.sort(key=lambda var: len(occurs[var]) * len(occurs[-var]))
+
+        for var in candidates:
+            if self.unsat or self._expired():
+                return
+            if var in self.fixed:
+                continue
+            positive = list(occurs[var])
+            negative = list(occurs[-var])
+            if not positive and not negative:
+                continue
+            if len(positive) * len(negative) > ELIMINATION_LIMIT:
+                continue
+
+            resolvents = self._resolvents(var, positive, negative)
+            if resolvents is None:
+                continue
+            if self.proof is not None:
+                for lits in resolvents:
+                    self.proof.add([encode(lit) for lit in lits])
+
+            for index in positive:
+                self.stack.append((var, sorted(self.clauses[index])))
+                self._remove(index)
+            for index in negative:
+                self.stack.append((-var, sorted(self.clauses[index])))
+                self._remove(index)
+            self.eliminated.add(var)
+            for lits in resolvents:
+                self._add(lits)
+            self._propagate()
+            self._subsume()
+
+    def _expired(self) -> bool:
+        return self.budget is not None and self.budget.expired() is not None
+
+    def _resolvents(self, var: int, positive: List[int], negative: List[int]) -> Optional[List[set]]:
+        """Non-tautological resolvents on var, or None if they would grow the formula"""
+        limit = len(positive) + len(negative)
+        resolvents = []
+        for p in positive:
+            base = self.clauses[p] - {var}
+            for n in negative:
+                other = self.clauses[n] - {-var}
+                if any(-lit in base for lit in other):
+                    continue
+                resolvent = base | other
+                if len(resolvent) > RESOLVENT_LIMIT or len(resolvents) == limit:
+                    return None
+                resolvents.append(resolvent)
+        return resolvents
+
+
+def preprocess(formula: CNFFormula, eliminate: bool = True, proof=None,
+               budget=None) -> Preprocessor:
+    """Run the full simplification pipeline on a parsed formula"""
+    preprocessor = Preprocessor(formula.num_vars, formula.clauses, proof, budget)
+    preprocessor.run(eliminate)
+    return preprocessor
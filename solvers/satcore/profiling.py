@@ -0,0 +1,180 @@
+"""
+Profiling hooks
+
+Two profilers, both writing collapsed stacks: one line per distinct stack,
+frames joined by ';' from the outermost in, followed by a count. That is the
+input format of flamegraph.pl, speedscope and inferno.
+
+SamplingProfiler interrupts the solver every few milliseconds of CPU time
+(SIGPROF) and records the interpreted stack. The search phase is read off
+the stack itself, from the innermost solver method known to belong to one,
+and becomes the root frame, so the flamegraph splits into propagate, decide,
+analyze, simplify and restart first. The solver does no extra work for it;
+the cost is one short stack walk per sample. Platforms without setitimer
+sample from a background thread instead.
+
+CProfileProfiler runs the deterministic cProfile, which is exact but slows
+the search several times. Besides the raw pstats dump, it writes collapsed
+stacks rebuilt from cProfile's caller/callee edges. cProfile keeps no full
+stacks, so a function's time is split over the paths reaching it in
+proportion to the cumulative time recorded along each caller edge.
+"""
+
+import cProfile
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+# Innermost matching function -> search phase it belongs to
+PHASE_OF = {
+    "_setup": "setup",
+    "_unit_propagate": "propagate",
+    "_decide": "decide",
+    "_learn": "analyze",
+    "_check_node": "simplify",
+    "_restart": "restart",
+    "_import_clauses": "restart",
+    "preprocess": "preprocess",
+    "parse_dimacs": "parse",
+}
+
+
+def frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{code.co_name}"
+
+
+def phase_of(names: List[str]) -> str:
+    """Search phase of a stack of function names, innermost last"""
+    for name in reversed(names):
+        phase = PHASE_OF.get(name)
+        if phase is not None:
+            return phase
+    return "search"
+
+
+class SamplingProfiler:
+    """Records the stack of the profiled thread every interval seconds of CPU time"""
+
+    def __init__(self, interval: float = 0.002):
+        self.interval = interval
+        self.samples = Counter()  # Collapsed stack -> samples
+        self.thread_id = None
+        self.sampler = None  # Fallback sampling thread
+        self.running = False
+
+    def start(self):
+        self.running = True
+        self.thread_id = threading.get_ident()
+        if hasattr(signal, "setitimer"):
+            signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self.sampler = threading.Thread(target=self._sample_loop, daemon=True)
+            self.sampler.start()
+
+    def stop(self):
+        self.running = False
+        if self.sampler is not None:
+            self.sampler.join()
+            self.sampler = None
+        elif hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def _on_signal(self, signum, frame):
+        self._record(frame)
+
+    def _sample_loop(self):
+        while self.running:
+            time.sleep(self.interval)
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame):
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        phase = phase_of([frame.f_code.co_name for frame in frames])
+        self.samples[";".join([phase] + [frame_label(frame) for frame in frames])] += 1
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class CProfileProfiler:
+    """cProfile with a pstats dump and collapsed stacks in microseconds"""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write(self, path: str):
+        """Collapsed stacks to path, the raw pstats dump to path + '.prof'"""
+        self.profile.dump_stats(path + ".prof")
+        with open(path, "w") as f:
+            for stack, micros in sorted(collapse_pstats(self.profile).items()):
+                if micros > 0:
+                    f.write(f"{stack} {micros}\n")
+
+
+def _pstats_label(func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name  # Built-in
+    module = filename.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    return f"{module}:{name}"
+
+
+def collapse_pstats(profile: cProfile.Profile) -> Dict[str, int]:
+    """Collapsed stacks with own time in microseconds, rebuilt from caller/callee edges"""
+    profile.create_stats()
+    stats = profile.stats  # func -> (primitive calls, calls, own time, total time, callers)
+    callees = {func: [] for func in stats}
+    for func, (cc, nc, tt, ct, callers) in stats.items():
+        for caller, edge in callers.items():
+            if caller in callees:
+                callees[caller].append((func, edge[3]))  # Edge's cumulative time
+
+    collapsed = Counter()
+
+    def walk(func, path: List[str], on_path: set, share: float):
+        cc, nc, tt, ct, callers = stats[func]
+        path.append(_pstats_label(func))
+        on_path.add(func)
+        collapsed[";".join([phase_of([label.rsplit(":", 1)[-1] for label in path])] + path)] += \
+            int(tt * share * 1e6)
+        for callee, edge_time in callees[func]:
+            total = stats[callee][3]
+            # Paths worth less than a microsecond are cut to keep the walk small
+            if callee not in on_path and total > 0 and edge_time * share >= 1e-6:
+                walk(callee, path, on_path, share * min(1.0, edge_time / total))
+        on_path.discard(func)
+        path.pop()
+
+    for func, (cc, nc, tt, ct, callers) in stats.items():
+        if not any(caller in stats for caller in callers):
+            walk(func, [], set(), 1.0)
+    return collapsed
+
+
+def make_profiler(mode: str, interval: float = 0.002):
+    """'sample' or 'cprofile'"""
+    if mode == "sample":
+        return SamplingProfiler(interval)
+    if mode == "cprofile":
+        return CProfileProfiler()
+    raise ValueError(f"Unknown profile mode: {mode}")
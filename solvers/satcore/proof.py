@@ -0,0 +1,214 @@
+"""
+DRAT proofs of unsatisfiability
+
+While solving, every learned clause is logged as a proof step, and so is
+every clause the preprocessor adds or deletes. An unsat answer ends the
+proof with the empty clause. DratWriter writes the steps in the text format
+("1 -2 0", "d 1 -2 0") or the binary one: an 'a' or 'd' byte, then each
+literal as a variable-length number, then a 0 byte. A binary literal is
+2 * var + sign, the engine's own encoding, so learned clauses go out
+without decoding. Steps are collected in a byte buffer and written in large
+blocks, which keeps the cost of logging to a few percent of the search.
+
+check_proof replays a proof against the formula with the engine's watched
+propagation and accepts it once the empty clause follows by unit
+propagation. Every added clause must be RUP: falsifying it has to
+propagate to a conflict. That covers everything this solver logs. Deletions
+are skipped; keeping clauses the formula implies anyway cannot make a
+wrong RUP step pass. drat-trim, when it is on the PATH, is used instead by
+check_proof_file.
+"""
+
+import shutil
+import subprocess
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .clausedb import ClauseDB
+from .dimacs import parse_dimacs
+from .literals import UNASSIGNED, decode, encode
+from .propagation import WatchedPropagator
+from .trail import Trail
+
+BUFFER_SIZE = 1 << 16  # Bytes collected before a write to the proof file
+_TEXT_BYTES = frozenset(b"0123456789- d\t\r\nc")
+
+
+class DratWriter:
+    """Buffered DRAT proof output; literals are given in engine encoding"""
+
+    def __init__(self, target: Union[str, BinaryIO], binary: bool = True):
+        self.file = open(target, "wb") if isinstance(target, str) else target
+        self.owned = isinstance(target, str)  # Close the file with the writer
+        self.binary = binary
+        self.buffer = bytearray()
+        self.codes = {}  # Literal -> its bytes in the proof
+        self.added = 0
+        self.deleted = 0
+
+    def add(self, lits: Iterable[int]):
+        self._step(b"a" if self.binary else b"", lits)
+        self.added += 1
+
+    def delete(self, lits: Iterable[int]):
+        self._step(b"d" if self.binary else b"d ", lits)
+        self.deleted += 1
+
+    def _step(self, prefix: bytes, lits: Iterable[int]):
+        buffer = self.buffer
+        codes = self.codes
+        buffer += prefix
+        for lit in lits:
+            code = codes.get(lit)
+            if code is None:
+                code = codes[lit] = self._code(lit)
+            buffer += code
+        buffer += b"\x00" if self.binary else b"0\n"
+        if len(buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def _code(self, lit: int) -> bytes:
+        if not self.binary:
+            return b"%d " % decode(lit)
+        code = bytearray()
+        while lit > 0x7f:
+            code.append(lit & 0x7f | 0x80)
+            lit >>= 7
+        code.append(lit)
+        return bytes(code)
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+def read_proof(path: str, binary: Optional[bool] = None) -> Iterator[Tuple[bool, List[int]]]:
+    """
+    Steps of a DRAT proof file as (deletion, engine literals). The format is
+    detected from the first bytes unless binary is given: a text proof only
+    holds digits, '-', 'd', 'c' and whitespace.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if binary is None:
+        binary = not _TEXT_BYTES.issuperset(data[:256])
+    return _binary_steps(data) if binary else _text_steps(data)
+
+
+def _binary_steps(data: bytes) -> Iterator[Tuple[bool, List[int]]]:
+    position = 0
+    end = len(data)
+    while position < end:
+        kind = data[position]
+        position += 1
+        if kind not in (0x61, 0x64):
+            raise ValueError(f"Bad binary DRAT step marker {kind:#x} at byte {position - 1}")
+        lits = []
+        while True:
+            if position >= end:
+                raise ValueError("Truncated binary DRAT proof")
+            lit = 0
+            shift = 0
+            while True:
+                byte = data[position]
+                position += 1
+                lit |= (byte & 0x7f) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            if lit == 0:
+                break
+            lits.append(lit)
+        yield kind == 0x64, lits
+
+
+def _text_steps(data: bytes) -> Iterator[Tuple[bool, List[int]]]:
+    deletion = False
+    lits = []
+    for line in data.splitlines():
+        words = line.split()
+        if not words or words[0] == b"c":
+            continue
+        for word in words:
+            if word == b"d":
+                deletion = True
+                continue
+            lit = int(word)
+            if lit == 0:
+                yield deletion, lits
+                deletion = False
+                lits = []
+            else:
+                lits.append(encode(lit))
+
+
+def check_proof(db: ClauseDB, num_vars: int, steps: Iterable[Tuple[bool, List[int]]]) -> bool:
+    """True if the proof steps derive the empty clause from the clauses of db"""
+    propagator = WatchedPropagator(db.copy(), num_vars)
+    trail = Trail(bytearray([UNASSIGNED]) * (num_vars + 1))
+
+    if propagator.has_empty_clause:
+        return True
+    for lit in propagator.units:
+        value = trail.value(lit)
+        if value is False:
+            return True
+        if value is None:
+            trail.assign(lit)
+    if not propagator.propagate(trail):
+        return True
+
+    for deletion, lits in steps:
+        if deletion:
+            continue
+        if any(lit >> 1 > num_vars for lit in lits):
+            return False  # A fresh variable needs a RAT step
+
+        # RUP: with every literal false, propagation must conflict
+        trail.new_decision_level()
+        satisfied = False
+        for lit in lits:
+            value = trail.value(lit)
+            if value is True:
+                satisfied = True
+                break
+            if value is None:
+                trail.assign(lit ^ 1)
+        if not satisfied and propagator.propagate(trail):
+            return False
+        trail.backtrack(0)
+
+        # Keep the lemma without its literals false at the top level
+        if any(trail.value(lit) is True for lit in lits):
+            continue
+        free = list(dict.fromkeys(lit for lit in lits if trail.value(lit) is None))
+        if not free:
+            return True
+        propagator.add_clause(free)
+        if len(free) == 1:
+            trail.assign(free[0])
+            if not propagator.propagate(trail):
+                return True
+
+    return False
+
+
+def check_proof_file(cnf_path: str, proof_path: str) -> bool:
+    """
+    Check a proof file with drat-trim if it is installed and can read the
+    formula (it takes no compressed input), otherwise with check_proof
+    """
+    drat_trim = shutil.which("drat-trim")
+    if drat_trim and not cnf_path.endswith((".gz", ".xz", ".bz2")):
+        completed = subprocess.run([drat_trim, cnf_path, proof_path],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        return "s VERIFIED" in completed.stdout
+
+    db, num_vars, num_clauses = parse_dimacs(cnf_path)
+    return check_proof(db, max(num_vars, db.max_var), read_proof(proof_path))
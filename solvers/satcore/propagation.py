@@ -0,0 +1,125 @@
+"""
+Two-watched-literal unit propagation
+
+Every clause with two or more literals watches the first two positions of
+its slice in the clause database. Watch lists are indexed by encoded
+literal, so assigning a literal only visits the clauses that currently
+watch its negation. Watches are never touched on backtrack: undoing
+assignments in reverse order keeps every watch valid.
+"""
+
+from array import array
+from typing import List
+
+from .clausedb import ClauseDB
+from .literals import TRUE, FALSE
+from .trail import Trail
+
+
+class WatchedPropagator:
+    """Unit propagation over a clause database using two watched literals"""
+
+    def __init__(self, db: ClauseDB, num_vars: int):
+        self.db = db
+        self.watches = [array('i') for _ in range(2 * num_vars + 2)]  # Literal -> clauses watching it
+        self.units = []  # Literals of the unit clauses in the database
+        self.has_empty_clause = False
+        self.conflict = -1  # Clause falsified by the last failed propagation
+
+        for index in range(len(db)):
+            self._watch(index)
+
+    def add_clause(self, lits: List[int]) -> int:
+        """
+        Add a clause of encoded literals to the database and return its index.
+        Its first two literals become the watches, so callers adding a clause
+        under a partial assignment must order them accordingly.
+        """
+        index = self.db.add_encoded(lits)
+        self._watch(index)
+        return index
+
+    def grow(self, num_vars: int):
+        """Make room for watches on variables up to num_vars"""
+        watches = self.watches
+        watches.extend(array('i') for _ in range(2 * num_vars + 2 - len(watches)))
+
+    def _watch(self, index: int):
+        db = self.db
+        base = db.start[index]
+        size = db.size[index]
+        if size == 0:
+            self.has_empty_clause = True
+        elif size == 1:
+            self.units.append(db.lits[base])
+        else:
+            self.watches[db.lits[base]].append(index)
+            self.watches[db.lits[base + 1]].append(index)
+
+    def propagate(self, trail: Trail) -> bool:
+        """
+        Propagate the trail from trail.qhead to a fixpoint.
+        Implied literals are assigned on the trail at the current decision level.
+        Returns False on conflict, leaving the falsified clause index in self.conflict.
+        """
+        self.conflict = -1
+        lits = self.db.lits
+        start = self.db.start
+        size = self.db.size
+        watches = self.watches
+        values = trail.assignment
+        queue = trail.trail
+
+        while trail.qhead < len(queue):
+            false_lit = queue[trail.qhead] ^ 1
+            trail.qhead += 1
+            watchers = watches[false_lit]
+            i = 0
+            j = 0
+
+            while i < len(watchers):
+                index = watchers[i]
+                i += 1
+                base = start[index]
+
+                # Keep the falsified watch in position 1
+                other = lits[base]
+                if other == false_lit:
+                    other = lits[base + 1]
+                    lits[base] = other
+                    lits[base + 1] = false_lit
+
+                other_value = values[other >> 1] ^ (other & 1)
+                if other_value == TRUE:
+                    watchers[j] = index
+                    j += 1
+                    continue
+
+                # Look for a replacement watch that is not false
+                for k in range(base + 2, base + size[index]):
+                    lit = lits[k]
+                    if values[lit >> 1] ^ (lit & 1) != FALSE:
+                        lits[base + 1] = lit
+                        lits[k] = false_lit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watchers[j] = index
+                    j += 1
+
+                    if other_value == FALSE:
+                        # Every literal is false
+                        self.conflict = index
+                        while i < len(watchers):
+                            watchers[j] = watchers[i]
+                            j += 1
+                            i += 1
+                        del watchers[j:]
+                        trail.qhead = len(queue)
+                        return False
+
+                    trail.assign(other, index)
+
+            del watchers[j:]
+
+        return True
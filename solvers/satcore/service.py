@@ -0,0 +1,284 @@
+"""
+Solver service
+
+A long-running process that answers solve requests over HTTP, on localhost
+TCP or a Unix socket, from a pool of solver processes forked once at
+start-up. A query then pays for neither interpreter start-up nor imports:
+
+    python solvers/serve.py --port 8765 --workers 4
+    curl --data-binary @formula.cnf 'http://127.0.0.1:8765/solve?heuristic=bohm&time_limit=10'
+
+    python solvers/serve.py --socket /tmp/sat.sock
+    curl --unix-socket /tmp/sat.sock --data-binary @formula.cnf http://localhost/solve
+
+POST /solve takes the formula as the request body: DIMACS text, plain or
+gzip/xz/bzip2 compressed, or the binary CNF of satcore.dimacs when sent as
+application/octet-stream (or with format=binary). Query parameters set up
+the run: strategy, heuristic, polarity, seed, learning=0, pure, preprocess=1,
+model=0, stats=1, and the budgets max_conflicts, max_propagations,
+time_limit (seconds) and max_memory (MB) with the service's budget flags as
+defaults. The answer is the solver output: sat/unsat/unknown, `v` lines,
+then `c` lines. It is sent with chunked transfer encoding, the first line
+on its own, so a client can act on it while a long model is still arriving.
+Connections stay open for further requests.
+
+GET /status reports the pool size and the requests served and running.
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socketserver
+import stat
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .budget import Budget
+from .cli import run_solver
+from .dimacs import DimacsError, parse_binary_cnf, parse_dimacs_bytes
+from .formula import CNFFormula
+from .heuristics import HEURISTICS
+from .model import model_lines
+from .phase import POLARITY_MODES
+from .solver import PURE_MODES, make_solver
+from .strategies import STRATEGIES
+
+STREAM_LINES = 256  # Output lines per chunk after the answer line
+BINARY_TYPE = "application/octet-stream"
+
+
+def _flag(value: str) -> bool:
+    if value not in ("0", "1"):
+        raise ValueError(f"expected 0 or 1, got {value!r}")
+    return value == "1"
+
+
+def _choice(choices):
+    def parse(value: str) -> str:
+        if value not in choices:
+            raise ValueError(f"expected one of {', '.join(sorted(choices))}, got {value!r}")
+        return value
+    return parse
+
+
+# Query parameter -> parser of its value
+PARAMETERS = {
+    "strategy": _choice(STRATEGIES),
+    "heuristic": _choice(HEURISTICS),
+    "polarity": _choice(POLARITY_MODES),
+    "seed": int,
+    "learning": _flag,
+    "pure": _choice(PURE_MODES),
+    "preprocess": _flag,
+    "model": _flag,
+    "stats": _flag,
+    "max_conflicts": int,
+    "max_propagations": int,
+    "time_limit": float,
+    "max_memory": float,
+    "format": _choice(("dimacs", "binary")),
+}
+
+
+def solve_request(payload: bytes, binary: bool, options: dict) -> List[str]:
+    """Run one request in a pool worker; returns the output lines"""
+    limits = (options["max_conflicts"], options["max_propagations"], options["time_limit"],
+              options["max_memory"])
+    budget = None if all(limit is None for limit in limits) else Budget(*limits)
+
+    start = time.perf_counter()
+    if binary:
+        db, num_vars, num_clauses = parse_binary_cnf(payload)
+    else:
+        db, num_vars, num_clauses = parse_dimacs_bytes(payload)
+    formula = CNFFormula(num_vars, db)
+    parse_time = time.perf_counter() - start
+
+    solver = make_solver(options["strategy"], options["heuristic"], options["learning"],
+                         options["pure"], polarity=options["polarity"], seed=options["seed"])
+    solver.budget = budget
+    result, assignment = run_solver(solver, formula, options["preprocess"])
+    solver.stats.times["parse"] = parse_time
+
+    if result is None:
+        lines = ["unknown"]
+    else:
+        lines = ["sat" if result else "unsat"]
+    if result and options["model"]:
+        lines += model_lines(assignment, formula.num_vars)
+    if options["stats"] or result is None:
+        lines += solver.stats.lines()
+    return lines
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    """POST /solve and GET /status"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, and chunked responses
+    server_version = "satcore"
+
+    def do_GET(self):
+        if urlparse(self.path).path != "/status":
+            self._reply(404, ["unknown", "c no such endpoint"])
+            return
+        server = self.server
+        self._reply(200, ["ok", f"c workers {server.workers}", f"c served {server.served}",
+                          f"c running {server.running}"])
+
+    def do_POST(self):
+        # Read the body first so the connection stays usable whatever the reply
+        length = self.headers.get("Content-Length", "")
+        if not length.isdigit():
+            self.close_connection = True
+            self._reply(411, ["unknown", "c Content-Length required"])
+            return
+        payload = self.rfile.read(int(length))
+
+        url = urlparse(self.path)
+        if url.path != "/solve":
+            self._reply(404, ["unknown", "c no such endpoint"])
+            return
+        try:
+            options = dict(self.server.defaults)
+            for name, values in parse_qs(url.query, keep_blank_values=True).items():
+                if name not in PARAMETERS:
+                    raise ValueError(f"unknown parameter {name!r}")
+                options[name] = PARAMETERS[name](values[-1])
+        except ValueError as e:
+            self._reply(400, ["unknown", f"c bad request: {e}"])
+            return
+        binary = options.pop("format", None) == "binary" or \
+            self.headers.get("Content-Type", "").split(";")[0].strip() == BINARY_TYPE
+
+        server = self.server
+        with server.lock:
+            server.running += 1
+        try:
+            lines = server.pool.apply(solve_request, (payload, binary, options))
+        except (DimacsError, ValueError) as e:
+            self._reply(400, ["unknown", f"c bad formula: {e}"])
+            return
+        except Exception as e:
+            self._reply(500, ["unknown", f"c error: {e!r}"])
+            return
+        finally:
+            with server.lock:
+                server.running -= 1
+                server.served += 1
+        self._stream(lines)
+
+    def _reply(self, status: int, lines: List[str]):
+        body = ("\n".join(lines) + "\n").encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, lines: List[str]):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        blocks = [lines[:1]] + [lines[i:i + STREAM_LINES] for i in range(1, len(lines), STREAM_LINES)]
+        for block in blocks:
+            data = ("\n".join(block) + "\n").encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            sys.stderr.write("c " + format % args + "\n")
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ThreadingHTTPServer's counterpart on a Unix socket"""
+
+    daemon_threads = True
+
+
+def make_server(pool, workers: int, defaults: dict, host: str = "127.0.0.1", port: int = 8765,
+                socket_path: Optional[str] = None, verbose: bool = False):
+    """An HTTP server dispatching to pool, on socket_path if given, else on host:port"""
+    if socket_path is not None:
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)  # Left over from a service that did not shut down
+        server = UnixHTTPServer(socket_path, SolveHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), SolveHandler)
+    server.pool = pool
+    server.workers = workers
+    server.defaults = defaults
+    server.verbose = verbose
+    server.lock = threading.Lock()
+    server.served = 0
+    server.running = 0
+    return server
+
+
+def _terminate(signum, frame):
+    raise SystemExit(0)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Serve solve requests over HTTP from a pool of solver processes")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address to listen on")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: number of cores)")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="restart")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="vsids")
+    parser.add_argument("--max-conflicts", type=int, metavar="N", help="default conflict budget")
+    parser.add_argument("--max-propagations", type=int, metavar="N",
+                        help="default propagation budget")
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS", help="default time budget")
+    parser.add_argument("--max-memory", type=float, metavar="MB",
+                        help="default resident memory budget of a worker")
+    parser.add_argument("--verbose", action="store_true", help="log every request to stderr")
+    args = parser.parse_args(argv)
+
+    defaults = {
+        "strategy": args.strategy,
+        "heuristic": args.heuristic,
+        "polarity": "saved",
+        "seed": None,
+        "learning": True,
+        "pure": "all",
+        "preprocess": False,
+        "model": True,
+        "stats": False,
+        "max_conflicts": args.max_conflicts,
+        "max_propagations": args.max_propagations,
+        "time_limit": args.time_limit,
+        "max_memory": args.max_memory,
+    }
+    workers = args.workers or os.cpu_count() or 1
+
+    # Fork the workers before the server starts any threads
+    pool = multiprocessing.Pool(workers)
+    server = None
+    try:
+        server = make_server(pool, workers, defaults, args.host, args.port, args.socket,
+                             args.verbose)
+        signal.signal(signal.SIGTERM, _terminate)
+        where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+        print(f"c serving on {where} with {workers} workers", flush=True)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"c cannot listen: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if server is not None:
+            server.server_close()
+            if args.socket:
+                os.unlink(args.socket)
+        pool.terminate()
+        pool.join()
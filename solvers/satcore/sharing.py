@@ -0,0 +1,87 @@
+"""
+Learned-clause exchange between solver processes
+
+Workers solving the same formula publish their short learned clauses into
+one shared-memory ring of int words, each record being [origin, length,
+literals...]. Every worker keeps its own read cursor, so a clause is written
+once and read by all. Readers never block writers: a reader that falls more
+than a ring's length behind skips ahead and loses those clauses, and a read
+that a writer may have overwritten meanwhile is thrown away.
+"""
+
+import multiprocessing
+from typing import List, Tuple
+
+
+class ClauseRing:
+    """Fixed-capacity shared-memory ring of clauses, written by every worker and read by all"""
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity = capacity
+        self.words = multiprocessing.RawArray('i', capacity)
+        self.head = multiprocessing.RawValue('q', 0)  # Total words ever written
+        self.lock = multiprocessing.Lock()  # Serializes writers
+
+    def publish(self, origin: int, lits: List[int]):
+        record = [origin, len(lits)]
+        record.extend(lits)
+        capacity = self.capacity
+        if len(record) > capacity:
+            return
+        words = self.words
+        with self.lock:
+            head = self.head.value
+            for offset, word in enumerate(record):
+                words[(head + offset) % capacity] = word
+            self.head.value = head + len(record)
+
+    def read(self, cursor: int) -> Tuple[int, List[Tuple[int, List[int]]]]:
+        """Records written since cursor as (origin, literals), and the new cursor"""
+        capacity = self.capacity
+        head = self.head.value
+        if head - cursor > capacity:
+            return head, []
+
+        words = self.words
+        records = []
+        position = cursor
+        while position < head:
+            origin = words[position % capacity]
+            length = words[(position + 1) % capacity]
+            start = position + 2
+            if length < 0 or start + length > head:
+                return self.head.value, []  # Overwritten under us
+            lits = [words[(start + k) % capacity] for k in range(length)]
+            records.append((origin, lits))
+            position = start + length
+
+        if self.head.value - cursor > capacity:
+            # A writer lapped us while we were reading
+            return self.head.value, []
+        return head, records
+
+
+class ClauseSharing:
+    """One worker's connection to a ClauseRing, with the export filter"""
+
+    def __init__(self, ring: ClauseRing, worker_id: int, max_length: int = 8, max_lbd: int = 2):
+        self.ring = ring
+        self.worker_id = worker_id
+        self.max_length = max_length
+        self.max_lbd = max_lbd  # Clauses up to this many decision levels are shared at any length
+        self.cursor = 0
+        self.exported = 0
+        self.imported = 0
+
+    def export(self, lits: List[int], lbd: int):
+        """Publish a learned clause if it is short or has a low literal block distance"""
+        if len(lits) <= self.max_length or lbd <= self.max_lbd:
+            self.ring.publish(self.worker_id, lits)
+            self.exported += 1
+
+    def collect(self) -> List[List[int]]:
+        """Clauses other workers published since the last call"""
+        self.cursor, records = self.ring.read(self.cursor)
+        clauses = [lits for origin, lits in records if origin != self.worker_id]
+        self.imported += len(clauses)
+        return clauses
@@ -0,0 +1,413 @@
+"""
+DPLL / CDCL search engine
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .analysis import analyze_conflict, analyze_final
+from .formula import CNFFormula
+from .heuristics import HEURISTICS
+from .literals import TRUE, UNASSIGNED
+from .occurrence import OccurrenceCounts
+from .propagation import WatchedPropagator
+from .stats import COUNTERS, SolverStats
+from .strategies import STRATEGIES
+from .trail import Trail
+
+# Pure literal elimination at every node, at decision level 0 only, or never
+PURE_MODES = ("all", "root", "off")
+
+
+class DPLLSolver:
+    """Base DPLL SAT Solver, with conflict-driven clause learning unless learning=False"""
+
+    def __init__(self, strategy, heuristic, learning: bool = True):
+        self.strategy = strategy
+        self.heuristic = heuristic
+        self.learning = learning
+        self.decisions = 0
+        self.conflicts = 0
+        self.propagations = 0
+        self.restarts = 0
+        self.learned = 0
+        self.learned_literals = 0
+        self.pure_literals = 0
+        self.stats = SolverStats()  # Phase times of the last solve; counters filled at the end
+        self.latency = False  # Record decision/propagation latency histograms in stats
+        self.propagator = None
+        self.trail = None
+        self.occurrences = None  # Free occurrence counts over the irredundant clauses
+        self.synced = 0  # Trail literals the occurrence counts still agree with
+        self.sharing = None  # Optional satcore.sharing.ClauseSharing with other workers
+        self.proof = None  # Optional satcore.proof.DratWriter for unsat answers
+        self.budget = None  # Optional satcore.budget.Budget; the search gives up when it runs out
+        self.exhausted = None  # Name of the budget limit that stopped the last solve
+        self.pure_mode = "all"  # One of PURE_MODES; only sound for a one-shot solve unless "off"
+        self.assumptions = []  # Encoded literals the CDCL search decides first, in order
+        self.failed = []  # Assumptions that made the last solve unsatisfiable
+
+    def solve(self, formula: CNFFormula) -> Tuple[Optional[bool], Dict[int, bool]]:
+        """(True, model), (False, {}), or (None, {}) when the budget ran out first"""
+        start = time.perf_counter()
+        self.stats = SolverStats(self.latency)
+        try:
+            return self._solve(formula)
+        finally:
+            self.stats.search = time.perf_counter() - start
+            for name in COUNTERS:
+                self.stats.counters[name] = getattr(self, name)
+            self.stats.exhausted = self.exhausted
+
+    def _solve(self, formula: CNFFormula) -> Tuple[Optional[bool], Dict[int, bool]]:
+        self._reset_counters()
+        start = time.perf_counter()
+        # Search a copy: it reorders clause literals, appends learned clauses
+        # and assigns variables, and the caller may solve formula again
+        formula = CNFFormula(formula.num_vars, formula.clauses.copy())
+        ready = self._setup(formula)
+        self.stats.times["setup"] += time.perf_counter() - start
+        if not ready:
+            return False, {}
+
+        result = self._cdcl(formula) if self.learning else self._dpll(formula)
+        return result, self._get_model(formula) if result else {}
+
+    def _reset_counters(self):
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.exhausted = None
+
+    def _setup(self, formula: CNFFormula) -> bool:
+        """Build the search state over formula and assign its unit clauses; False if they clash"""
+        self.propagator = WatchedPropagator(formula.clauses, formula.num_vars)
+        self.trail = Trail(formula.assignment)
+        # Registers the original clauses; learned ones are never counted
+        self.occurrences = OccurrenceCounts(formula.clauses, formula.num_vars)
+        self.heuristic.on_setup(formula, self.occurrences)
+        self.synced = 0
+
+        if self.propagator.has_empty_clause:
+            self._log([])
+            return False
+
+        for lit in self.propagator.units:
+            value = self.trail.value(lit)
+            if value is False:
+                self._log([])
+                return False
+            if value is None:
+                self.trail.assign(lit)
+        return True
+
+    def _dpll(self, formula: CNFFormula) -> Optional[bool]:
+        """Iterative DPLL search; an explicit stack of branch points replaces recursion"""
+        # Open branch points: [decision literal, level before branching, flipped]
+        branches = []
+        budget = self.budget
+
+        while True:
+            if budget is not None:
+                self.exhausted = budget.exhausted(self)
+                if self.exhausted is not None:
+                    return None
+            if not self._unit_propagate(formula):
+                failed = True
+            else:
+                status = self._check_node(formula)
+                if status is True:
+                    return True
+                failed = status is False
+
+            if not failed and self.strategy.should_restart(self.conflicts, self.decisions):
+                self._restart()
+                branches.clear()
+                continue
+
+            if not failed:
+                level = self.trail.decision_level()
+                branches.append([self._decide(formula), level, False])
+                continue
+
+            start = time.perf_counter()
+            # The decisions on the stack cannot all hold: log that, and the
+            # same for each shorter stack whose last branch both values failed
+            self._log_branches(branches)
+
+            # Undo branch points until one still has its False value to try.
+            # Only the first pop has a falsified clause, the one propagation
+            # reported; the branch points undone after it end with none.
+            conflict = list(self.propagator.db.literals(self.propagator.conflict))
+            while branches:
+                branch = branches[-1]
+                self.conflicts += 1
+                self.heuristic.on_conflict(conflict)
+                conflict = []
+                self._backtrack(branch[1])
+
+                if not branch[2]:
+                    branch[2] = True
+                    self.trail.new_decision_level()
+                    self.trail.assign(branch[0] ^ 1)
+                    break
+
+                branches.pop()
+                self._log_branches(branches)
+            else:
+                return False
+            self.stats.times["analyze"] += time.perf_counter() - start
+
+    def _cdcl(self, formula: CNFFormula) -> Optional[bool]:
+        """Conflict-driven clause learning search with first-UIP learning and backjumping"""
+        budget = self.budget
+        while True:
+            if budget is not None:
+                self.exhausted = budget.exhausted(self)
+                if self.exhausted is not None:
+                    return None
+            if not self._unit_propagate(formula):
+                self.conflicts += 1
+                if self.trail.decision_level() == 0:
+                    self._log([])
+                    return False
+                self._learn(self.propagator.conflict)
+                continue
+
+            if self.trail.decision_level() < len(self.assumptions):
+                if not self._assume():
+                    return False
+                continue
+
+            status = self._check_node(formula)
+            if status is not None:
+                return status
+
+            if self.strategy.should_restart(self.conflicts, self.decisions):
+                self._restart()
+                if self.sharing is not None and not self._import_clauses():
+                    return False
+                continue
+
+            self._decide(formula)
+
+    def _learn(self, conflict: int):
+        """Learn the first-UIP clause of a conflict, backjump and assert it"""
+        start = time.perf_counter()
+        learned, backjump_level = analyze_conflict(self.trail, self.propagator.db, conflict)
+        self.learned += 1
+        self.learned_literals += len(learned)
+        self._log(learned)
+        self.heuristic.on_conflict(learned)
+        if self.sharing is not None:
+            level = self.trail.level
+            self.sharing.export(learned, len({level[lit >> 1] for lit in learned}))
+
+        # The strategy may stop above the asserting level; the learned
+        # clause stays unit there because its other literals are older
+        if len(learned) > 1:
+            backjump_level = max(backjump_level,
+                                 self.strategy.on_conflict(self.trail.decision_level()))
+
+        self._backtrack(backjump_level)
+        self.trail.assign(learned[0], self.propagator.add_clause(learned))
+        self.stats.times["analyze"] += time.perf_counter() - start
+
+    def _assume(self) -> bool:
+        """
+        Open a decision level for the next assumption, empty if it already
+        holds. Returns False, with the assumptions to blame in self.failed,
+        if it is already false.
+        """
+        lit = self.assumptions[self.trail.decision_level()]
+        value = self.trail.value(lit)
+        if value is False:
+            self.failed = analyze_final(self.trail, self.propagator.db, lit)
+            return False
+        self.trail.new_decision_level()
+        if value is None:
+            self.trail.assign(lit)
+        return True
+
+    def _log(self, lits: List[int]):
+        if self.proof is not None:
+            self.proof.add(lits)
+
+    def _log_branches(self, branches: List[list]):
+        """Log the negation of the decisions of the open branch points"""
+        if self.proof is not None:
+            self.proof.add([lit if flipped else lit ^ 1 for lit, level, flipped in branches])
+
+    def _import_clauses(self) -> bool:
+        """
+        Add the clauses other workers shared, at level 0 right after a restart.
+        Literals false at level 0 are dropped; returns False if nothing is left
+        of a clause, which makes the formula unsatisfiable.
+        """
+        start = time.perf_counter()
+        try:
+            return all(self._add_clause(lits) for lits in self.sharing.collect())
+        finally:
+            self.stats.times["restart"] += time.perf_counter() - start
+
+    def _add_clause(self, lits: List[int], irredundant: bool = False) -> bool:
+        """
+        Add a clause of encoded literals at level 0. A clause true there is
+        skipped and literals false there are dropped; returns False if none
+        are left. An irredundant clause, one not implied by the others, is
+        registered with the occurrence counts.
+        """
+        trail = self.trail
+        free = []
+        for lit in lits:
+            value = trail.value(lit)
+            if value is True:
+                return True
+            if value is None:
+                free.append(lit)
+        if not free:
+            return False
+        index = self.propagator.add_clause(free)
+        if irredundant:
+            self.occurrences.register(index)
+        if len(free) == 1:
+            trail.assign(free[0], index)
+        return True
+
+    def _restart(self):
+        """Return to level 0; activity scores and learned clauses are kept"""
+        start = time.perf_counter()
+        self.restarts += 1
+        self._backtrack(0)
+        self.stats.times["restart"] += time.perf_counter() - start
+
+    def _backtrack(self, level: int):
+        """Undo the levels above level; the occurrence counts are unwound by the next sync"""
+        self.heuristic.on_backtrack(self.trail.backtrack(level))
+        self.synced = min(self.synced, len(self.trail.trail))
+
+    def _check_node(self, formula: CNFFormula) -> Optional[bool]:
+        """
+        After a successful propagation: True if satisfied, None to branch.
+        Propagation already reported any falsified clause, and the occurrence
+        counts track how many irredundant clauses are satisfied, so this is
+        O(1) beyond catching the counts up with the trail. Learned clauses
+        follow from the irredundant ones and need no check. If the budget
+        runs out while the counts catch up, this returns None and the search
+        loop's next budget check ends the search.
+        """
+        start = time.perf_counter()
+        mode = self.pure_mode
+        if mode == "all" or mode == "root" and self.trail.decision_level() == 0:
+            synced = self._pure_literal_eliminate(formula)
+        else:
+            synced = self._sync_occurrences()
+        self.stats.times["simplify"] += time.perf_counter() - start
+
+        counts = self.occurrences
+        if synced and counts.satisfied == counts.clauses:
+            return True
+
+        return None
+
+    def _decide(self, formula: CNFFormula) -> int:
+        """Open a new decision level on the heuristic's literal; returns that literal"""
+        start = time.perf_counter()
+        var = self.heuristic.select_variable(formula)
+        if var is None:
+            var = formula.assignment.index(UNASSIGNED, 1)
+        lit = 2 * var if self.heuristic.select_polarity(formula, var) else 2 * var + 1
+
+        self.decisions += 1
+        self.trail.new_decision_level()
+        self.trail.assign(lit)
+        elapsed = time.perf_counter() - start
+        self.stats.times["decide"] += elapsed
+        if self.latency:
+            self.stats.record("decide", elapsed)
+        return lit
+
+    def _unit_propagate(self, formula: CNFFormula) -> bool:
+        start = time.perf_counter()
+        assigned_before = len(self.trail.trail)
+        ok = self.propagator.propagate(self.trail)
+        self.propagations += len(self.trail.trail) - assigned_before
+        elapsed = time.perf_counter() - start
+        self.stats.times["propagate"] += elapsed
+        if self.latency:
+            self.stats.record("propagate", elapsed)
+        return ok
+
+    def _pure_literal_eliminate(self, formula: CNFFormula) -> bool:
+        """
+        Assign pure literals. The occurrence counts catch up with the trail
+        and only the variables whose counts changed are examined, so a node
+        pays for the clauses its assignments touched rather than a full scan.
+
+        Purity is judged on the irredundant clauses, so a learned clause may
+        still hold the negation and later become a reason or conflict clause
+        through it. A pure literal has no reason of its own, so it gets a
+        decision level of its own and conflict analysis meets it as it would
+        a decision. Only at level 0 without a proof is it kept as a fact:
+        analysis skips level 0, but a proof could not justify it there.
+        Returns False if the budget ran out first.
+        """
+        counts = self.occurrences
+        trail = self.trail
+        while True:
+            if not self._sync_occurrences():
+                return False
+            pure = counts.pure_literals(formula.assignment)
+            if not pure:
+                return True
+            self.pure_literals += len(pure)
+            as_facts = trail.decision_level() == 0 and self.proof is None
+            for lit in pure:
+                if not as_facts:
+                    trail.new_decision_level()
+                trail.assign(lit)
+
+    def _sync_occurrences(self) -> bool:
+        """
+        Catch the occurrence counts up with the trail: undo the literals
+        backtracked over since the last call, newest first, then apply the
+        new ones. After a restart from deep in the search that is a long
+        walk, so the budget's clock is watched on the way; returns False,
+        with the counts part of the way there, if it runs out.
+        """
+        counts = self.occurrences
+        applied = counts.applied
+        trail = self.trail.trail
+        budget = self.budget
+        while len(applied) > self.synced:
+            counts.unassign()
+            if budget is not None and budget.expired() is not None:
+                return False
+        for lit in trail[len(applied):]:
+            counts.assign(lit)
+            if budget is not None and budget.expired() is not None:
+                self.synced = len(applied)
+                return False
+        self.synced = len(trail)
+        return True
+
+    def _get_model(self, formula: CNFFormula) -> Dict[int, bool]:
+        return {var: value == TRUE for var, value in enumerate(formula.assignment)
+                if var > 0 and value != UNASSIGNED}
+
+
+def make_solver(strategy: str = "restart", heuristic: str = "vsids", learning: bool = True,
+                pure: str = "all", **options) -> DPLLSolver:
+    """
+    Build a solver from registered strategy and heuristic names.
+    pure is one of PURE_MODES; options (polarity, seed, ...) go to the
+    heuristic's constructor.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    if pure not in PURE_MODES:
+        raise ValueError(f"Unknown pure literal mode: {pure}")
+    solver = DPLLSolver(STRATEGIES[strategy](), HEURISTICS[heuristic](**options), learning)
+    solver.pure_mode = pure
+    return solver
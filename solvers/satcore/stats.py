@@ -0,0 +1,96 @@
+"""
+Search statistics
+
+The solver adds the time of each call into its hot paths to a per-phase
+total with two perf_counter reads, which costs far less than the work being
+timed. Together with its counters, that is turned into `c` comment lines
+for the solver output or a JSON object.
+
+With latency recording on, the duration of every decision and every
+propagation call also goes into a histogram with power-of-two microsecond
+buckets: bucket b counts calls that took less than 2^b us (and at least
+2^(b-1) us).
+
+Phases:
+- parse: reading the DIMACS file (timed by the caller)
+- preprocess: satcore.preprocess (timed by the caller)
+- setup: copying the formula, building watch lists and occurrence counts
+  and assigning unit clauses
+- propagate: unit propagation
+- decide: heuristic bookkeeping and picking the decision literal
+- analyze: conflict analysis, learning and backjumping
+- simplify: occurrence-count upkeep and pure literal elimination
+- restart: restarts and importing shared clauses
+"""
+
+import json
+from typing import List
+
+PHASES = ("parse", "preprocess", "setup", "propagate", "decide", "analyze", "simplify", "restart")
+LATENCY_PHASES = ("decide", "propagate")  # Phases with per-call latency histograms
+COUNTERS = ("decisions", "conflicts", "propagations", "restarts", "learned", "learned_literals",
+            "pure_literals")
+
+
+class SolverStats:
+    """Per-phase times in seconds and search counters of one run"""
+
+    def __init__(self, latency: bool = False):
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.search = 0.0  # Wall time of DPLLSolver.solve
+        self.exhausted = None  # Budget limit that stopped the search, if one did
+        # Phase -> bucket counts, or None when latencies are not recorded
+        self.latency = {phase: [] for phase in LATENCY_PHASES} if latency else None
+
+    def record(self, phase: str, seconds: float):
+        """Count one call of phase that took seconds in its latency histogram"""
+        histogram = self.latency[phase]
+        bucket = int(seconds * 1e6).bit_length()
+        if bucket >= len(histogram):
+            histogram.extend([0] * (bucket + 1 - len(histogram)))
+        histogram[bucket] += 1
+
+    def as_dict(self) -> dict:
+        """Every time, counter and rate, plus latency histograms if recorded, as written to JSON"""
+        counters = self.counters
+        data = {f"{phase}_time": round(seconds, 6) for phase, seconds in self.times.items()}
+        data["search_time"] = round(self.search, 6)
+        data.update(counters)
+        data["exhausted"] = self.exhausted or ""
+        data["propagations_per_sec"] = round(counters["propagations"] / self.search, 1) \
+            if self.search > 0 else 0.0
+        data["mean_learned_length"] = round(counters["learned_literals"] / counters["learned"], 2) \
+            if counters["learned"] else 0.0
+        if self.latency is not None:
+            data["latency_us"] = {phase: {f"<{1 << bucket}": count
+                                          for bucket, count in enumerate(histogram) if count}
+                                  for phase, histogram in self.latency.items()}
+        return data
+
+    def lines(self) -> List[str]:
+        """`c` comment lines for the solver output"""
+        data = self.as_dict()
+        lines = [f"c {phase + ' time':<20} {data[phase + '_time']:10.4f} s" for phase in PHASES]
+        lines.append(f"c {'search time':<20} {data['search_time']:10.4f} s")
+        for name in COUNTERS + ("propagations_per_sec", "mean_learned_length"):
+            lines.append(f"c {name.replace('_', ' '):<20} {data[name]:>10}")
+        if self.exhausted:
+            lines.append(f"c {'budget exhausted':<20} {self.exhausted:>10}")
+        return lines
+
+    def latency_lines(self) -> List[str]:
+        """`c` lines with one row per latency bucket that was hit"""
+        lines = []
+        for phase, histogram in (self.latency or {}).items():
+            lines.append(f"c {phase} latency")
+            total = sum(histogram) or 1
+            for bucket, count in enumerate(histogram):
+                if count:
+                    lines.append(f"c   < {1 << bucket:>8} us {count:>10} {100 * count / total:6.2f}%")
+        return lines
+
+    def write_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,76 @@
+"""
+Search strategies
+
+A strategy decides when the search restarts and how far it backs up after a
+conflict. reset() starts its schedule over, for a solver that reuses it
+across solves with the conflict count back at 0. Strategies register under
+the name used for them on the command line.
+"""
+
+STRATEGIES = {}  # Name -> strategy class
+
+
+def register_strategy(name: str):
+    """Class decorator adding a strategy to STRATEGIES under name"""
+    def register(cls):
+        STRATEGIES[name] = cls
+        return cls
+    return register
+
+
+@register_strategy("chronological")
+class ChronologicalBacktrackingStrategy:
+    """Traditional DPLL with chronological backtracking - never restarts"""
+
+    def __init__(self):
+        self.name = "Chronological"
+
+    def should_restart(self, conflicts: int, decisions: int) -> bool:
+        return False
+
+    def on_conflict(self, level: int) -> int:
+        return level - 1 if level > 0 else 0
+
+    def reset(self):
+        pass
+
+
+@register_strategy("restart")
+class RestartStrategy:
+    """Periodic restart strategy using Luby sequence"""
+
+    def __init__(self, base_interval: int = 100):
+        self.name = "Restart"
+        self.base_interval = base_interval
+        self.reset()
+
+    def should_restart(self, conflicts: int, decisions: int) -> bool:
+        self.conflicts_since_restart = conflicts - self.last_restart_conflicts
+
+        if self.conflicts_since_restart >= self.limit:
+            self.restart_count += 1
+            self.last_restart_conflicts = conflicts
+            self.limit = next(self.luby) * self.base_interval
+            return True
+        return False
+
+    def on_conflict(self, level: int) -> int:
+        return 0
+
+    def reset(self):
+        self.conflicts_since_restart = 0
+        self.restart_count = 0
+        self.last_restart_conflicts = 0
+        self.luby = self._luby()
+        self.limit = next(self.luby) * self.base_interval
+
+    def _luby(self):
+        """Luby sequence 1, 1, 2, 1, 1, 2, 4, ... by reluctant doubling, O(1) per term"""
+        u, v = 1, 1
+        while True:
+            yield v
+            if u & -u == v:
+                u += 1
+                v = 1
+            else:
+                v *= 2
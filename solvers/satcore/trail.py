@@ -0,0 +1,69 @@
+"""
+Assignment trail with decision levels
+
+The solver keeps one assignment array (variable -> FALSE/TRUE/UNASSIGNED)
+and a trail of the encoded literals assigned into it, in order. trail_lim
+records where each decision level starts, so backtracking truncates the
+trail in place instead of copying the formula for every branch. Propagated
+literals keep the index of the clause that implied them, which forms the
+implication graph used by conflict analysis.
+"""
+
+from array import array
+from typing import List, Optional
+
+from .literals import TRUE, UNASSIGNED, NO_REASON
+
+
+class Trail:
+    """Ordered record of assigned literals over a shared assignment array"""
+
+    def __init__(self, assignment: bytearray):
+        self.assignment = assignment  # Variable -> FALSE/TRUE/UNASSIGNED
+        self.level = array('i', [0]) * len(assignment)  # Variable -> level it was assigned at
+        self.reason = array('i', [NO_REASON]) * len(assignment)  # Variable -> implying clause
+        self.trail = []  # Assigned literals, oldest first
+        self.trail_lim = []  # Trail length at the start of each decision level
+        self.qhead = 0  # Next trail position to propagate
+
+    def grow(self):
+        """Size the level and reason arrays to an assignment array that was extended"""
+        extra = len(self.assignment) - len(self.level)
+        self.level.extend(array('i', [0]) * extra)
+        self.reason.extend(array('i', [NO_REASON]) * extra)
+
+    def decision_level(self) -> int:
+        return len(self.trail_lim)
+
+    def value(self, lit: int) -> Optional[bool]:
+        """Truth value of lit, or None if its variable is unassigned"""
+        value = self.assignment[lit >> 1]
+        if value == UNASSIGNED:
+            return None
+        return (value ^ (lit & 1)) == TRUE
+
+    def assign(self, lit: int, reason: int = NO_REASON):
+        var = lit >> 1
+        self.assignment[var] = (lit & 1) ^ 1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def new_decision_level(self):
+        self.trail_lim.append(len(self.trail))
+
+    def backtrack(self, level: int) -> List[int]:
+        """Undo every decision level above level; returns the unassigned literals"""
+        if level >= len(self.trail_lim):
+            return []
+
+        start = self.trail_lim[level]
+        undone = self.trail[start:]
+        assignment = self.assignment
+        for lit in undone:
+            assignment[lit >> 1] = UNASSIGNED
+
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = min(self.qhead, start)
+        return undone
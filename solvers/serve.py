@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Solver service
+Answers solve requests over localhost HTTP or a Unix socket from a pool of
+solver processes started once
+"""
+
+from satcore.service import main
+
+
+if __name__ == "__main__":
+    main()
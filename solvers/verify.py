@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Model verifier
+Checks the `v` lines a solver printed against the original CNF formula,
+e.g. python solvers/4.py f.cnf --model | python solvers/verify.py f.cnf
+"""
+
+from satcore.model import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Quick test script for the DIMACS parser
+Parses the same formulas laid out across lines in awkward ways, plain and
+gzip/xz compressed, and checks the clauses and the solvers' answers
+"""
+import gzip
+import lzma
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, 'solvers')
+from satcore import parse_cnf, parse_dimacs_bytes  # noqa: E402
+
+# A clause spanning several lines, and several clauses on one line
+LAYOUT = "c layout check\np cnf 3 4\n1 -2\n3 0 -1 0 2\n0 -3\n{last} 0\n"
+# Last literal of the split clause -> (clauses, expected answer)
+CASES = {
+    "1": ([[1, -2, 3], [-1], [2], [-3, 1]], "unsat"),
+    "2": ([[1, -2, 3], [-1], [2], [-3, 2]], "sat"),
+}
+WRITERS = {"": open, ".gz": gzip.open, ".xz": lzma.open}
+# Repeated literals are dropped, also in a clause split across lines
+REPEATS = b"p cnf 3 3\n1 1 -2 0 3\n-3 3 0 2 -1 2 0\n"
+REPEATS_CLAUSES = [[1, -2], [3, -3], [2, -1]]
+
+
+def test_solver(solver_path, formula_path):
+    try:
+        result = subprocess.run(
+            ['python', solver_path, formula_path],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.stdout.strip()
+    except Exception as e:
+        return f"ERROR: {e}"
+
+
+print("=" * 80)
+print("PARSER TEST - Split clauses, shared lines and compressed input")
+print("=" * 80)
+
+all_passed = True
+
+with tempfile.TemporaryDirectory() as tmp:
+    for last, (expected_clauses, expected) in CASES.items():
+        for suffix, writer in WRITERS.items():
+            path = os.path.join(tmp, f"layout_{last}.cnf{suffix}")
+            with writer(path, "wt") as f:
+                f.write(LAYOUT.format(last=last))
+
+            clauses = [list(clause) for clause in parse_cnf(path).clauses]
+            answers = [test_solver(solver, path) for solver in ('solvers/1.py', 'solvers/4.py')]
+            ok = clauses == expected_clauses and answers == [expected, expected]
+            print(f"  {os.path.basename(path):20} -> {clauses} {answers} {'ok' if ok else 'FAIL'}")
+            all_passed = all_passed and ok
+
+clauses = [list(clause) for clause in parse_dimacs_bytes(REPEATS)[0]]
+ok = clauses == REPEATS_CLAUSES
+print(f"  {'repeated literals':20} -> {clauses} {'ok' if ok else 'FAIL'}")
+all_passed = all_passed and ok
+
+print("\n" + "=" * 80)
+if all_passed:
+    print("✓ ALL TESTS PASSED! Every layout parses to the same clauses.")
+else:
+    print("✗ SOME TESTS FAILED! A layout parsed differently.")
+print("=" * 80)
+sys.exit(0 if all_passed else 1)
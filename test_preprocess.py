@@ -0,0 +1,74 @@
+"""
+Quick test script for --preprocess
+Runs the solvers with and without preprocessing on 5 formulas: the answers
+must agree, every sat model must satisfy the original formula, and every
+unsat proof must pass the bundled RUP checker
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, 'solvers')
+from satcore import parse_dimacs  # noqa: E402
+from satcore.model import check_model, parse_model  # noqa: E402
+from satcore.proof import check_proof, read_proof  # noqa: E402
+
+
+def run_solver(solver_path, formula_path, *flags):
+    try:
+        result = subprocess.run(
+            ['python', solver_path, formula_path] + list(flags),
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.stdout.strip().splitlines() or ["ERROR: no output"]
+    except Exception as e:
+        return [f"ERROR: {e}"]
+
+
+# Test formulas
+test_formulas = [1, 2, 10, 20, 50]
+solvers = ['solvers/3.py', 'solvers/4.py']
+
+print("=" * 80)
+print("PREPROCESS TEST - Answers, extended models and proofs with --preprocess")
+print("=" * 80)
+
+all_passed = True
+
+with tempfile.TemporaryDirectory() as tmp:
+    proof_path = os.path.join(tmp, "proof.drat")
+    for formula_num in test_formulas:
+        formula_path = f'benchmark/formula_{formula_num}.cnf'
+        db, num_vars, num_clauses = parse_dimacs(formula_path)
+        print(f"\nTesting formula_{formula_num}.cnf:")
+        print("-" * 40)
+
+        for solver in solvers:
+            plain = run_solver(solver, formula_path)[0]
+            output = run_solver(solver, formula_path, '--preprocess', '--model',
+                                '--proof', proof_path)
+            answer = output[0]
+            if answer == "sat":
+                checked = check_model(db, parse_model(output))
+                check = "model ok" if checked else "MODEL WRONG"
+            elif answer == "unsat":
+                checked = check_proof(db, num_vars, read_proof(proof_path))
+                check = "proof ok" if checked else "PROOF WRONG"
+            else:
+                checked, check = False, "no answer"
+            passed = checked and answer == plain
+            print(f"  {solver:15} plain -> {plain:6} preprocess -> {answer:6} {check}")
+            if not passed:
+                print(f"  WARNING: {solver} failed with --preprocess!")
+                all_passed = False
+
+print("\n" + "=" * 80)
+if all_passed:
+    print("✓ ALL TESTS PASSED! Preprocessing keeps every answer and certificate right.")
+else:
+    print("✗ SOME TESTS FAILED! Preprocessing changed an answer or broke a certificate.")
+print("=" * 80)
+sys.exit(0 if all_passed else 1)
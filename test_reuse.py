@@ -0,0 +1,63 @@
+"""
+Quick test script for solving one formula more than once
+Parses 5 formulas once each and solves every one twice with every strategy
+and heuristic, plus the cube splitter: the answers must agree, every model
+must satisfy the formula, and the formula must come back unchanged
+"""
+import sys
+
+sys.path.insert(0, 'solvers')
+from satcore import parse_cnf  # noqa: E402
+from satcore.cubes import Cuber  # noqa: E402
+from satcore.model import check_model  # noqa: E402
+from satcore.solver import make_solver  # noqa: E402
+
+
+def snapshot(formula):
+    return [list(clause) for clause in formula.clauses], bytes(formula.assignment)
+
+
+# Test formulas
+test_formulas = [1, 2, 10, 20, 50]
+configs = [(strategy, heuristic) for strategy in ('chronological', 'restart')
+           for heuristic in ('vsids', 'bohm')]
+
+print("=" * 80)
+print("REUSE TEST - Solving the same parsed formula twice")
+print("=" * 80)
+
+all_passed = True
+
+for formula_num in test_formulas:
+    formula = parse_cnf(f'benchmark/formula_{formula_num}.cnf')
+    before = snapshot(formula)
+    print(f"\nTesting formula_{formula_num}.cnf:")
+    print("-" * 40)
+
+    for strategy, heuristic in configs:
+        answers = []
+        for _ in range(2):
+            try:
+                result, model = make_solver(strategy, heuristic).solve(formula)
+            except Exception as e:
+                result, model = f"ERROR: {e}", {}
+            if result is True and not check_model(formula.clauses, model):
+                result = "MODEL WRONG"
+            answers.append(result)
+        passed = answers[0] == answers[1] and answers[0] in (True, False)
+        print(f"  {strategy + '+' + heuristic:25} -> {answers}")
+        all_passed = all_passed and passed
+
+    cubes = [len(Cuber(formula).cubes(3)) for _ in range(2)]
+    print(f"  {'cuber (depth 3)':25} -> {cubes} cubes")
+    unchanged = snapshot(formula) == before and cubes[0] == cubes[1]
+    print(f"  {'formula afterwards':25} -> {'unchanged' if unchanged else 'CHANGED'}")
+    all_passed = all_passed and unchanged
+
+print("\n" + "=" * 80)
+if all_passed:
+    print("✓ ALL TESTS PASSED! Solving leaves the formula as parsed.")
+else:
+    print("✗ SOME TESTS FAILED! A solve changed the formula or its answer.")
+print("=" * 80)
+sys.exit(0 if all_passed else 1)